@@ -1 +1,7 @@
 # FastAPI Portfolio Backend
+import os
+from dotenv import load_dotenv
+
+# Load .env once for every app module; on Vercel the environment is already set
+if not os.getenv("VERCEL"):
+    load_dotenv()
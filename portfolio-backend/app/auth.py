@@ -1,14 +1,12 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import os
+import time
+import asyncio
+import hashlib
 import logging
-import requests as http_requests
-from dotenv import load_dotenv
-from supabase import create_client, Client
 import jwt
-from jwt import PyJWKClient
-
-load_dotenv()
+from app.cache import TTLCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("auth")
@@ -24,21 +22,100 @@ if not all([SUPABASE_URL, SUPABASE_ANON_KEY]):
 
 # JWKS endpoint for verifying ES256 tokens
 JWKS_URL = f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json"
-jwks_client = None
-try:
-    jwks_client = PyJWKClient(JWKS_URL)
-    logger.info(f"JWKS client initialized for {JWKS_URL}")
-except Exception as e:
-    logger.warning(f"Could not initialize JWKS client: {e}")
-
-# Create Supabase client with anon key (for authentication)
-try:
-    from supabase import create_client as _create_client
-    supabase: Client = _create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-except Exception as e:
-    print(f"Warning: Could not initialize Supabase client: {e}")
-    print("JWT verification will still work for authentication.")
-    supabase = None
+JWKS_CACHE_TTL = float(os.getenv("JWKS_CACHE_TTL", "600"))
+JWKS_MIN_REFETCH_INTERVAL = 30  # seconds between forced fetches for an unknown kid
+JWKS_RETRY_INTERVAL = 2  # seconds before fetching again after a failed fetch
+
+
+class JWKSCache:
+    """Signing keys from the Supabase JWKS endpoint, keyed by `kid`.
+
+    Keys past their TTL keep being served while a background task refreshes them,
+    so a request only waits on the network when it presents a `kid` we have never
+    seen (key rotation) - and even then at most once per JWKS_MIN_REFETCH_INTERVAL
+    (JWKS_RETRY_INTERVAL after a failed fetch). Nothing is fetched until an ES256
+    token shows up, so instances that only serve public reads never do.
+    """
+
+    def __init__(self, url: str, ttl: float = JWKS_CACHE_TTL):
+        self.url = url
+        self.ttl = ttl
+        self._keys = {}
+        self._fetched_at = 0.0  # last successful fetch
+        self._attempted_at = 0.0
+        self._retry_at = 0.0  # earliest forced fetch for an unknown kid
+        self._refresh_task = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self):
+        requested_at = time.monotonic()
+        async with self._lock:
+            if self._attempted_at >= requested_at:
+                return  # fetched while we were waiting for the lock (concurrent cold requests)
+            try:
+                import httpx  # only needed once an ES256 token shows up
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    resp = await client.get(self.url)
+                resp.raise_for_status()
+                key_set = jwt.PyJWKSet.from_dict(resp.json())
+                self._keys = {key.key_id: key for key in key_set.keys}
+                logger.info(f"Loaded {len(self._keys)} signing key(s) from {self.url}")
+                self._fetched_at = time.monotonic()
+                self._retry_at = self._fetched_at + JWKS_MIN_REFETCH_INTERVAL
+            except Exception as e:
+                # Keep serving the keys we already have, and try again soon
+                logger.warning(f"Could not refresh JWKS: {e}")
+                self._retry_at = time.monotonic() + JWKS_RETRY_INTERVAL
+            self._attempted_at = time.monotonic()
+
+    def _refresh_in_background(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+
+    def close(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+
+    async def get_signing_key(self, kid: str):
+        now = time.monotonic()
+        age = now - self._fetched_at
+        key = self._keys.get(kid)
+        if key is None and now >= self._retry_at:
+            # Unknown kid: the keys were rotated (or never loaded), fetch them now
+            await self.refresh()
+            key = self._keys.get(kid)
+        elif key is not None and age > self.ttl:
+            self._refresh_in_background()
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: kid={kid}")
+        return key
+
+
+jwks_cache = JWKSCache(JWKS_URL)
+
+# Tokens that already passed signature verification, keyed by their SHA-256 and
+# kept no longer than the token's own exp, so repeat admin calls skip the ECDSA verify
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", "1024"))
+VERIFIED_TOKEN_CACHE_TTL = float(os.getenv("VERIFIED_TOKEN_CACHE_TTL", "300"))
+verified_tokens = TTLCache(maxsize=VERIFIED_TOKEN_CACHE_SIZE, ttl=VERIFIED_TOKEN_CACHE_TTL)
+
+_supabase = None
+
+def get_supabase():
+    """Supabase client with anon key (for authentication), created on first use.
+
+    Importing the supabase package is one of the slowest steps of a cold start,
+    and only the login/register routes need it.
+    """
+    global _supabase
+    if _supabase is None:
+        try:
+            from supabase import create_client
+            _supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+        except Exception as e:
+            print(f"Warning: Could not initialize Supabase client: {e}")
+            print("JWT verification will still work for authentication.")
+    return _supabase
 
 security = HTTPBearer()
 
@@ -46,15 +123,42 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Verify Supabase JWT token and return user info"""
-    token = credentials.credentials
+    return await verify_token(credentials.credentials)
+
+
+async def is_admin_request(request: Request) -> bool:
+    """Whether the request carries a valid admin token (memoized per request).
+
+    For routes that only change behaviour for admins (public reads going to the primary
+    and past the caches), so an unverified Authorization header gets the anonymous path.
+    Every signed-in user is an admin here (see get_current_active_admin).
+    """
+    if getattr(request.state, "is_admin", None) is None:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        user = None
+        if scheme.lower() == "bearer" and token:
+            try:
+                user = await verify_token(token)
+            except HTTPException:
+                pass
+        request.state.is_admin = user is not None
+    return request.state.is_admin
+
+
+async def verify_token(token: str):
+    """The user of a Supabase JWT; HTTPException (401) when it doesn't verify"""
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    user = verified_tokens.get(token_hash, None)
+    if user is not None:
+        return user
     
     try:
         header = jwt.get_unverified_header(token)
         alg = header.get("alg", "HS256")
         
-        if alg == "ES256" and jwks_client:
+        if alg == "ES256":
             # New ECC key — verify using JWKS public key
-            signing_key = jwks_client.get_signing_key_from_jwt(token)
+            signing_key = await jwks_cache.get_signing_key(header.get("kid"))
             payload = jwt.decode(
                 token,
                 signing_key.key,
@@ -81,12 +185,16 @@ async def get_current_user(
                 detail="Invalid authentication token"
             )
         
-        logger.info(f"Auth success: user={email}, alg={alg}")
-        return {
+        logger.debug(f"Auth success: user={email}, alg={alg}")
+        user = {
             "id": user_id,
             "email": email,
             "role": payload.get("role", "user")
         }
+        expires_in = payload["exp"] - time.time() if "exp" in payload else None
+        if expires_in is None or expires_in > 0:
+            verified_tokens.set(token_hash, user, ttl=expires_in)
+        return user
         
     except jwt.ExpiredSignatureError:
         raise HTTPException(
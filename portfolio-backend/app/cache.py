@@ -0,0 +1,211 @@
+import os
+import time
+import hashlib
+import inspect
+from collections import OrderedDict
+from functools import wraps
+from fastapi import Request, Response
+from sqlalchemy import select, func, literal, union_all
+from app.compression import COMPRESSION_MIN_SIZE, base_etag, compress, encoded_etag, negotiate
+from app.edge import public_headers, purge_edge
+
+# Public content changes rarely; writes on this instance invalidate immediately,
+# the TTL bounds staleness for writes made through other (serverless) instances.
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries expire after `ttl` seconds and are tagged with the tables they read."""
+
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, tables, value)
+
+    def get(self, key, default=_MISSING):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def set(self, key, value, tables=(), ttl: float = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (time.monotonic() + ttl, frozenset(tables), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *tables):
+        """Drop every entry that was built from one of `tables`"""
+        stale = [key for key, entry in self._entries.items() if entry[1].intersection(tables)]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+
+cache = TTLCache()
+
+
+async def invalidate(*tables):
+    """After a write: drop what this instance cached from `tables`, refresh the SQLite replica
+    (when SQLITE_REPLICA_PATH is set), purge the CDN's copies and refresh the static snapshot
+    (when SNAPSHOT_ON_WRITE is set)"""
+    from app.database import mark_write
+    from app.replica import refresh_replica
+    from app.snapshot import refresh_snapshot
+
+    mark_write()
+    cache.invalidate(*tables)
+    await refresh_replica()  # before the purge, so the CDN refetches from an up-to-date replica
+    await purge_edge(tables)
+    await refresh_snapshot()
+
+
+async def table_versions(*tables, db=None):
+    """Return a content version per table: (row count, max(updated_at)).
+
+    The count catches deletes, max(updated_at) catches inserts and updates. Versions are
+    cached like any other entry, so writes on this instance bump them immediately.
+    With `db`, they're read from that session, uncached: versions that describe exactly
+    what the caller reads through it (see app.snapshot).
+    """
+    from app.database import Base, read_sessionmaker
+
+    if db is None:
+        versions = {name: cache.get(("version", name)) for name in tables}
+    else:
+        versions = dict.fromkeys(tables, _MISSING)
+    missing = [name for name, version in versions.items() if version is _MISSING]
+    if missing:
+        # One round trip for every table we don't have a version for yet
+        selects = [
+            select(
+                literal(name).label("name"),
+                func.count().label("rows"),
+                func.max(Base.metadata.tables[name].c.updated_at).label("updated_at"),
+            ).select_from(Base.metadata.tables[name])
+            for name in missing
+        ]
+        statement = selects[0] if len(selects) == 1 else union_all(*selects)
+        if db is not None:
+            result = await db.execute(statement)
+            versions.update((name, f"{rows}:{updated_at}") for name, rows, updated_at in result.all())
+            return versions
+        # From wherever the public routes read, so the ETag describes what they serve
+        async with (await read_sessionmaker())() as session:
+            result = await session.execute(statement)
+        for name, rows, updated_at in result.all():
+            versions[name] = f"{rows}:{updated_at}"
+            cache.set(("version", name), versions[name], (name,))
+    return versions
+
+
+def matching_etag(if_none_match: str, etag: str):
+    """The If-None-Match tag that matches `etag` (the content's ETag), or None.
+
+    Compressed representations carry their own `"<hash>-br"`/`"<hash>-gzip"` ETag, which
+    still matches the content's. The client's tag is returned so a 304 confirms the
+    representation it holds.
+    """
+    if if_none_match.strip() == "*":
+        return etag
+    for tag in (tag.strip() for tag in if_none_match.split(",")):
+        # If-None-Match uses the weak comparison, so ignore any W/ prefix
+        if base_etag(tag[2:] if tag.startswith("W/") else tag) == etag:
+            return tag
+    return None
+
+
+def not_modified(if_none_match: str, etag: str, tables):
+    """304 for a matching If-None-Match, None otherwise"""
+    tag = matching_etag(if_none_match, etag) if if_none_match else None
+    if tag is None:
+        return None
+    return Response(status_code=304, headers={"ETag": tag, "Vary": "Accept-Encoding", **public_headers(tables)})
+
+
+def encoded_response(key, value: Response, tables, etag: str, accept_encoding: str) -> Response:
+    """Rebuild a cached response, compressed for the client when it's big enough.
+
+    The compressed bytes are cached per encoding next to the body (same tables, so the
+    same invalidation), so a hot body is compressed once rather than on every hit; the
+    Content-Encoding header makes CompressionMiddleware leave it alone.
+    """
+    headers = {"ETag": etag, **public_headers(tables)}
+    body = value.body
+    encoding = negotiate(accept_encoding) if len(body) >= COMPRESSION_MIN_SIZE else None
+    if encoding:
+        # Keyed by ETag too: the body may be reloaded (TTL) while its compressed copies live on
+        compressed = cache.get((key, etag, encoding))
+        if compressed is _MISSING:
+            compressed = compress(body, encoding)
+            cache.set((key, etag, encoding), compressed, tables)
+        body = compressed
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = encoded_etag(etag, encoding)
+        headers["Vary"] = "Accept-Encoding"  # CompressionMiddleware adds it to uncompressed bodies
+    return Response(body, status_code=value.status_code, media_type=value.media_type, headers=headers)
+
+
+def cached(*tables):
+    """Read-through cache plus ETag/If-None-Match for a GET handler whose result only
+    depends on `tables` and its query params.
+
+    Place it under the @router.get decorator. The `db` dependency is left out of the key,
+    and since get_db is lazy a cache hit never opens a session. A matching If-None-Match
+    is answered with a 304 from the table versions alone, without running the handler.
+    Responses are marked CDN-cacheable and tagged with `tables` for purges (see app.edge).
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(*args, _etag_request: Request, _etag_response: Response, **kwargs):
+            from app.auth import is_admin_request
+
+            if await is_admin_request(_etag_request):
+                # Admin: read the primary (see read_sessionmaker), past this instance's cache
+                return await handler(*args, **kwargs)
+            params = tuple(sorted(
+                (name, value) for name, value in kwargs.items() if name != "db"
+            ))
+            key = (handler.__module__, handler.__name__, params)
+
+            versions = await table_versions(*tables)
+            etag = '"%s"' % hashlib.sha256(
+                repr((key, sorted(versions.items()))).encode()
+            ).hexdigest()[:32]
+            unchanged = not_modified(_etag_request.headers.get("if-none-match"), etag, tables)
+            if unchanged:
+                return unchanged
+            _etag_response.headers["ETag"] = etag
+            _etag_response.headers.update(public_headers(tables))
+
+            # Keyed by ETag too: when the versions move on (TTL, or a write through another
+            # instance) the body is rebuilt, rather than served under an ETag it doesn't match
+            value = cache.get((key, etag))
+            if value is _MISSING:
+                value = await handler(*args, **kwargs)
+                cache.set((key, etag), value, tables)
+            if isinstance(value, Response):
+                # An encoded body is shared between hits: answer with a fresh response around it
+                return encoded_response(key, value, tables, etag, _etag_request.headers.get("accept-encoding"))
+            return value
+
+        # Expose the request/response to FastAPI next to the handler's own parameters
+        signature = inspect.signature(handler)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_etag_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_etag_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        wrapper.cached_tables = tables
+        return wrapper
+    return decorator
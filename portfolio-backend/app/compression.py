@@ -0,0 +1,151 @@
+import os
+import gzip
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+
+# Below this size the encoding overhead isn't worth it
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 11 is for build-time assets, 4-6 is the usual on-the-fly trade-off
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+
+def supported_encodings():
+    return ("br", "gzip") if brotli else ("gzip",)
+
+
+def negotiate(accept_encoding: str):
+    """Pick the best encoding the client accepts (br over gzip), honouring q=0"""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name.strip()] = q
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of the `encoding` representation: each encoding gets its own (RFC 9110 8.8.3)"""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def base_etag(etag: str) -> str:
+    """Undo encoded_etag(): the ETag of the content, whatever encoding it was sent in"""
+    for encoding in ("br", "gzip"):
+        if etag.endswith(f'-{encoding}"'):
+            return f'{etag[:-len(encoding) - 2]}"'
+    return etag
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compressible(content_type: str) -> bool:
+    return (content_type or "").startswith(COMPRESSIBLE_TYPES)
+
+
+class _StreamCompressor:
+    """Incremental compressor for bodies sent in several chunks"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._flush = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._flush = self._compressor.flush
+        self._process = getattr(self._compressor, "process", None) or self._compressor.compress
+
+    def compress(self, chunk: bytes, last: bool) -> bytes:
+        data = self._process(chunk)
+        return data + self._flush() if last else data
+
+
+class CompressionMiddleware:
+    """gzip/brotli negotiation for every response of at least `minimum_size` bytes.
+
+    Responses that already carry a Content-Encoding pass through untouched: that's how
+    cached public routes hand over bodies they compressed once (see app.cache).
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not compressible(headers.get("content-type")):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held back until we know whether the body is worth compressing
+                    start = message
+                    MutableHeaders(raw=start["headers"]).add_vary_header("Accept-Encoding")
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None and start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                if encoding is None or (not more_body and len(body) < self.minimum_size):
+                    await send(start)
+                    start = None
+                    passthrough = True
+                    await send(message)
+                    return
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], encoding)
+                if more_body:
+                    del headers["Content-Length"]
+                    compressor = _StreamCompressor(encoding)
+                else:
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    start = None
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start)
+                start = None
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, last=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,29 @@
+from fastapi import HTTPException
+from sqlalchemy import delete, select, update
+
+
+async def update_by_id(db, model, object_id: str, values: dict, not_found: str):
+    """Apply `values` to one row with a single UPDATE ... RETURNING and commit.
+
+    Returns the updated instance (server-side defaults like updated_at included)
+    without a SELECT before or a refresh after; no matching row is a 404.
+    """
+    if values:
+        statement = update(model).where(model.id == object_id).values(**values).returning(model)
+    else:
+        # Nothing to change: just return the row
+        statement = select(model).where(model.id == object_id)
+    result = await db.execute(statement)
+    instance = result.scalar_one_or_none()
+    if instance is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    await db.commit()
+    return instance
+
+
+async def delete_by_id(db, model, object_id: str, not_found: str):
+    """Delete one row with a single DELETE ... RETURNING id and commit; no matching row is a 404"""
+    result = await db.execute(delete(model).where(model.id == object_id).returning(model.id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    await db.commit()
@@ -1,49 +1,202 @@
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+import time
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Read replica (e.g. a Neon read replica) for the public GET routes; writes stay on DATABASE_URL
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+# Read-only SQLite copy of the public tables, shipped with the deployment (built by build_replica.py)
+SQLITE_REPLICA_PATH = os.getenv("SQLITE_REPLICA_PATH")
+# After a write, this instance reads from the primary for this long (seconds): what it caches,
+# and what the CDN refetches after the purge, then already includes the write despite replica lag
+READ_YOUR_WRITES_WINDOW = float(os.getenv("READ_YOUR_WRITES_WINDOW", "10"))
+# libpq-only query parameters, which asyncpg.connect() rejects as unknown keywords.
+# channel_binding is dropped: asyncpg negotiates SCRAM without it.
+LIBPQ_PARAMETERS = [
+    "sslmode", "channel_binding", "connect_timeout", "target_session_attrs", "application_name", "options",
+]
+
+
+def _to_async_url(url: str):
+    """Map a sync database URL onto its async driver (asyncpg / aiosqlite)."""
+    async_url = make_url(url)
+    connect_args = {}
+    if async_url.drivername.startswith("sqlite"):
+        async_url = async_url.set(drivername="sqlite+aiosqlite")
+    else:
+        async_url = async_url.set(drivername="postgresql+asyncpg")
+        # asyncpg does not understand libpq's query parameters (e.g. Neon's
+        # ?sslmode=require&channel_binding=require): translate them or drop them
+        query = async_url.query
+        async_url = async_url.difference_update_query(LIBPQ_PARAMETERS)
+        sslmode = query.get("sslmode")
+        if sslmode and sslmode != "disable":
+            connect_args["ssl"] = "require"
+        if query.get("connect_timeout"):
+            connect_args["timeout"] = float(query["connect_timeout"])
+        if query.get("target_session_attrs"):
+            connect_args["target_session_attrs"] = query["target_session_attrs"]
+        # libpq sends these as startup parameters, which is what server_settings are
+        server_settings = {name: query[name] for name in ("application_name", "options") if query.get(name)}
+        if server_settings:
+            connect_args["server_settings"] = server_settings
+        # Supabase's pooler (pgbouncer, transaction mode) can't keep prepared statements
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+    return async_url, connect_args
+
+
+def _create_async_engine(url: str):
+    async_url, connect_args = _to_async_url(url)
+    if async_url.drivername.startswith("sqlite"):
+        return create_async_engine(async_url)
+    # For serverless: smaller pool, shorter timeout, aggressive recycling
+    return create_async_engine(
+        async_url,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        pool_size=2,
+        max_overflow=3,
+        pool_recycle=300,
+        pool_timeout=30
+    )
+
 
 if not DATABASE_URL:
     # Fallback to local SQLite if no DATABASE_URL is set
     print("⚠️ WARNING: No DATABASE_URL environment variable found!")
     print("⚠️ Using local SQLite database - this won't work in production!")
     DATABASE_URL = "sqlite:///./portfolio.db"
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 elif DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
     print(f"📁 Using SQLite database")
 else:
     # PostgreSQL (Supabase or other)
-    # For serverless: smaller pool, shorter timeout, aggressive recycling
-    try:
-        engine = create_engine(
-            DATABASE_URL, 
-            pool_pre_ping=True,
-            pool_size=2,
-            max_overflow=3,
-            pool_recycle=300,
-            pool_timeout=30
-        )
-        print(f"🐘 Using PostgreSQL database")
-    except Exception as e:
-        print(f"❌ Failed to create database engine: {e}")
-        # Fallback to SQLite to prevent complete failure
-        DATABASE_URL = "sqlite:///./portfolio.db"
-        engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-        print("⚠️ Falling back to SQLite database")
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    print(f"🐘 Using PostgreSQL database")
+
+# Async engine used by the API routers so queries don't block the event loop.
+# Creating it doesn't connect; the first query does.
+try:
+    async_engine = _create_async_engine(DATABASE_URL)
+except Exception as e:
+    print(f"❌ Failed to create database engine: {e}")
+    # Fallback to SQLite to prevent complete failure
+    DATABASE_URL = "sqlite:///./portfolio.db"
+    async_engine = _create_async_engine(DATABASE_URL)
+    print("⚠️ Falling back to SQLite database")
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
+class LazySession:
+    """Proxy that only opens an AsyncSession when a handler actually touches it,
+    so requests answered from the cache never create a session or check out a connection."""
+
+    def __init__(self, factory=None):
+        self._factory = factory or AsyncSessionLocal
+        self._session = None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
+async def get_db():
+    db = LazySession()
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
+
+
+_read = {}
+_last_write_at = 0.0
+
+
+def mark_write():
+    """Called after a commit: start this instance's read-your-writes window"""
+    global _last_write_at
+    _last_write_at = time.monotonic()
+
+
+def _read_replica_sessionmaker():
+    # Built on first use, like the primary's pool it doesn't connect until a query runs
+    if not _read:
+        _read["engine"] = _create_async_engine(DATABASE_READ_URL)
+        _read["sessionmaker"] = async_sessionmaker(_read["engine"], autoflush=False, expire_on_commit=False)
+    return _read["sessionmaker"]
+
+
+async def read_sessionmaker(request: Request = None):
+    """Session factory for the public read routes.
+
+    The primary for requests with a valid admin token (an admin checking what they just
+    saved) and during this instance's read-your-writes window; otherwise the embedded
+    SQLite replica when SQLITE_REPLICA_PATH is set (see app.replica), the DATABASE_READ_URL
+    replica when that is, and the primary when neither is.
+    """
+    from app.auth import is_admin_request
+
+    if time.monotonic() - _last_write_at < READ_YOUR_WRITES_WINDOW or (
+        request is not None and await is_admin_request(request)
+    ):
+        return AsyncSessionLocal
+    if SQLITE_REPLICA_PATH:
+        from app.replica import replica
+        return await replica.sessionmaker()
+    if DATABASE_READ_URL:
+        return _read_replica_sessionmaker()
+    return AsyncSessionLocal
+
+
+# Dependency for public GET routes (admin reads and every write use get_db)
+async def get_read_db(request: Request):
+    db = LazySession(await read_sessionmaker(request))
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def dispose_engines():
+    """Release pooled connections of the primary and of the read replica"""
+    await async_engine.dispose()
+    if _read:
+        await _read["engine"].dispose()
+
+
+_sync = {}
+
+def __getattr__(name):
+    """Sync `engine` / `SessionLocal` for the scripts (seed_data.py, create_admin.py, migrate.py).
+
+    Built on first access so the API, which only uses the async engine, never
+    imports psycopg2 or builds a second pool on a cold start.
+    """
+    if name not in ("engine", "SessionLocal"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if not _sync:
+        if DATABASE_URL.startswith("sqlite"):
+            engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+        else:
+            engine = create_engine(
+                DATABASE_URL,
+                pool_pre_ping=True,
+                pool_size=2,
+                max_overflow=3,
+                pool_recycle=300,
+                pool_timeout=30
+            )
+        _sync["engine"] = engine
+        _sync["SessionLocal"] = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _sync[name]
@@ -0,0 +1,67 @@
+import os
+import logging
+from starlette.datastructures import MutableHeaders
+from app.storage import storage
+
+logger = logging.getLogger("edge")
+
+# How long the CDN serves a public response before revalidating it, and how long it may keep
+# serving the stale copy while it does. Purges make writes show up before s-maxage runs out.
+EDGE_MAX_AGE = int(os.getenv("EDGE_MAX_AGE", "300"))
+EDGE_STALE_WHILE_REVALIDATE = int(os.getenv("EDGE_STALE_WHILE_REVALIDATE", "86400"))
+# Browsers always revalidate (a cheap 304 thanks to the ETag), only the CDN holds on to copies
+PUBLIC_CACHE_CONTROL = (
+    f"public, max-age=0, s-maxage={EDGE_MAX_AGE}, stale-while-revalidate={EDGE_STALE_WHILE_REVALIDATE}"
+)
+PRIVATE_CACHE_CONTROL = "private, no-store"
+
+# Purge webhook (the CDN's tag invalidation endpoint, or fake_edge.py locally)
+EDGE_PURGE_URL = os.getenv("EDGE_PURGE_URL")
+EDGE_PURGE_TOKEN = os.getenv("EDGE_PURGE_TOKEN")
+EDGE_PURGE_TIMEOUT = float(os.getenv("EDGE_PURGE_TIMEOUT", "5"))
+EDGE_TAG_HEADER = os.getenv("EDGE_TAG_HEADER", "Cache-Tag")
+
+
+def public_headers(tables) -> dict:
+    """Cache-Control for a public cached route, tagged with the tables it reads"""
+    return {"Cache-Control": PUBLIC_CACHE_CONTROL, EDGE_TAG_HEADER: ",".join(sorted(tables))}
+
+
+async def purge_edge(tables):
+    """Ask the CDN to drop every response tagged with one of `tables`.
+
+    Awaited by the write handlers (writes are rare, and a serverless function may be frozen
+    once it has answered); a failed purge is only logged, s-maxage bounds the staleness.
+    """
+    if not EDGE_PURGE_URL or not tables:
+        return
+    headers = {"Authorization": f"Bearer {EDGE_PURGE_TOKEN}"} if EDGE_PURGE_TOKEN else {}
+    try:
+        resp = await storage.client.post(
+            EDGE_PURGE_URL, json={"tags": sorted(tables)}, headers=headers, timeout=EDGE_PURGE_TIMEOUT
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Edge purge of {sorted(tables)} failed: {e}")
+
+
+class CacheControlMiddleware:
+    """Responses that don't set their own Cache-Control (admin, auth, uploads, contact...)
+    get `private, no-store`, so nothing is cached by a CDN unless a route opts in."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_policy(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_policy)
@@ -0,0 +1,151 @@
+import io
+import os
+import json
+import base64
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from app.storage import storage, IMMUTABLE_CACHE_CONTROL
+
+logger = logging.getLogger("images")
+
+# Raster formats we make responsive variants for (SVG scales on its own, GIFs may be animated)
+DERIVATIVE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+DERIVATIVE_WIDTHS = (320, 640, 1024, 1600)
+DERIVATIVE_FORMATS = (("avif", "image/avif", 50), ("webp", "image/webp", 80))  # (format, content type, quality)
+PLACEHOLDER_WIDTH = 16
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+_executor = None
+
+
+def _pool():
+    # Threads rather than processes: Pillow releases the GIL while resizing/encoding,
+    # and serverless runtimes don't support multiprocessing's shared-memory queues
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="images")
+    return _executor
+
+
+def wants_derivatives(filename: str) -> bool:
+    return os.path.splitext(filename)[1].lower() in DERIVATIVE_EXTENSIONS
+
+
+def derivative_name(filename: str, width: int, fmt: str) -> str:
+    return f"{os.path.splitext(filename)[0]}_{width}w.{fmt}"
+
+
+def manifest_name(filename: str) -> str:
+    return f"{os.path.splitext(filename)[0]}.srcset.json"
+
+
+async def stored_derivatives(filename: str, supabase_url: str):
+    """Every object the pipeline stored for an image (per its manifest), for cleanup on delete"""
+    names = [manifest_name(filename)]
+    try:
+        resp = await storage.client.get(storage.public_url(supabase_url, manifest_name(filename)), timeout=10.0)
+        if resp.status_code == 200:
+            names += [variant["url"].rsplit("/", 1)[1] for variant in resp.json().get("variants", [])]
+    except Exception as e:
+        logger.warning(f"Could not read the manifest of {filename}: {e}")
+    return names
+
+
+def render_derivatives(data: bytes, filename: str):
+    """Resize/re-encode one image (CPU-bound, runs in the worker pool).
+
+    Re-encoding drops EXIF/ICC/XMP metadata; EXIF orientation is applied first so
+    nothing ends up sideways. Never upscales. Returns the image's size, a blur
+    placeholder (data URI) and the encoded variants.
+    """
+    from PIL import Image, ImageFilter, ImageOps, features
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    width, height = image.size
+
+    variants = []
+    widths = [w for w in DERIVATIVE_WIDTHS if w < width] + [min(width, DERIVATIVE_WIDTHS[-1])]
+    for target in sorted(set(widths)):
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.LANCZOS
+        )
+        for fmt, content_type, quality in DERIVATIVE_FORMATS:
+            if not features.check(fmt):
+                continue
+            out = io.BytesIO()
+            resized.save(out, fmt.upper(), quality=quality)
+            variants.append((derivative_name(filename, target, fmt), content_type, target, out.getvalue()))
+
+    tiny = image.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))), Image.BILINEAR)
+    out = io.BytesIO()
+    tiny.filter(ImageFilter.GaussianBlur(1)).save(out, "WEBP", quality=30)
+    placeholder = "data:image/webp;base64," + base64.b64encode(out.getvalue()).decode()
+    return width, height, placeholder, variants
+
+
+def build_manifest(filename: str, supabase_url: str, width: int, height: int, placeholder: str, variants):
+    """srcset-style description of an image's variants, stored next to it as <name>.srcset.json"""
+    srcset = {}
+    for name, content_type, variant_width, _ in variants:
+        srcset.setdefault(content_type, []).append(f"{storage.public_url(supabase_url, name)} {variant_width}w")
+    return {
+        "status": "ready",
+        "src": storage.public_url(supabase_url, filename),
+        "width": width,
+        "height": height,
+        "placeholder": placeholder,
+        "srcset": {content_type: ", ".join(entries) for content_type, entries in srcset.items()},
+        "variants": [
+            {"url": storage.public_url(supabase_url, name), "type": content_type, "width": variant_width}
+            for name, content_type, variant_width, _ in variants
+        ],
+    }
+
+
+async def _put(name: str, content_type: str, body: bytes, cache_control: str, supabase_url: str, supabase_key: str):
+    resp = await storage.client.post(
+        storage.object_url(supabase_url, name), content=body,
+        headers={
+            **storage.auth_headers(supabase_key),
+            "Content-Type": content_type,
+            "Cache-Control": cache_control,
+            "x-upsert": "true",
+        },
+    )
+    resp.raise_for_status()
+
+
+async def process_image(filename: str, supabase_url: str, supabase_key: str):
+    """Background job: make the variants of an uploaded image and store them next to it.
+
+    The original is fetched back from storage when the job runs, rather than held in
+    memory from the upload until then, so a batch of large images only has one loaded
+    at a time. The manifest is written last, with "status": "ready" - or, when the image
+    can't be processed (corrupt, unsupported by Pillow), with "status": "failed".
+    """
+    try:
+        resp = await storage.client.get(storage.public_url(supabase_url, filename))
+        resp.raise_for_status()
+
+        loop = asyncio.get_running_loop()
+        width, height, placeholder, variants = await loop.run_in_executor(
+            _pool(), render_derivatives, resp.content, filename
+        )
+        manifest = build_manifest(filename, supabase_url, width, height, placeholder, variants)
+        # Variants are named after their original, so they're as immutable as it is
+        await asyncio.gather(*(
+            _put(name, content_type, body, IMMUTABLE_CACHE_CONTROL, supabase_url, supabase_key)
+            for name, content_type, _, body in variants
+        ))
+        logger.info(f"Stored {len(variants)} variants of {filename}")
+    except Exception as e:
+        logger.error(f"Image derivatives failed for {filename}: {e}")
+        manifest = {"status": "failed", "src": storage.public_url(supabase_url, filename), "error": str(e)}
+    try:
+        await _put(manifest_name(filename), "application/json", json.dumps(manifest).encode(), "no-cache",
+                   supabase_url, supabase_key)
+    except Exception as e:
+        logger.error(f"Could not store the manifest of {filename}: {e}")
@@ -0,0 +1,68 @@
+from typing import Optional
+from fastapi import Query
+from sqlalchemy import select, func
+
+LANGUAGES = ("en", "fr")
+
+
+def lang_query():
+    """`lang` query parameter shared by the public list routes"""
+    return Query(
+        None,
+        pattern="^(en|fr)$",
+        description="Only return this language's fields, without the _en/_fr suffix"
+    )
+
+
+def _localized_plan(table, lang: str):
+    """(name, source columns in fallback order) of each column of `table` projected onto `lang`"""
+    plan = []
+    for column in table.columns:
+        base, _, suffix = column.key.rpartition("_")
+        if suffix not in LANGUAGES:
+            plan.append((column.key, [column]))
+        elif suffix == lang:
+            fallbacks = [table.c[f"{base}_{other}"] for other in LANGUAGES if other != lang]
+            plan.append((base, [column, *fallbacks]))
+    return plan
+
+
+def localized_columns(model, lang: str):
+    """Columns of `model` projected onto one language.
+
+    `foo_en`/`foo_fr` pairs collapse into a single `foo` column holding the requested
+    language (falling back to the other one when it's empty); every other column is kept.
+    """
+    return [
+        sources[0] if len(sources) == 1
+        else func.coalesce(*sources, type_=sources[0].type).label(name)
+        for name, sources in _localized_plan(model.__table__, lang)
+    ]
+
+
+def localize_rows(table, rows, lang: str):
+    """localized_columns() applied in Python, to rows already selected with every column.
+
+    Lets one query serve every language (see app.portfolio_snapshot); NULL falls back
+    like COALESCE does.
+    """
+    plan = [(name, [column.key for column in sources]) for name, sources in _localized_plan(table, lang)]
+    return [
+        {name: next((row[key] for key in keys if row[key] is not None), None) for name, keys in plan}
+        for row in rows
+    ]
+
+
+def localized_select(model, lang: Optional[str] = None):
+    """Core select of `model`'s columns, or of only `lang`'s columns when a language is requested.
+
+    Columns rather than the entity: read-only lists don't need ORM instances.
+    """
+    if not lang:
+        return select(*model.__table__.columns)
+    return select(*localized_columns(model, lang))
+
+
+def localized_rows(result):
+    """Rows of a localized_select() result, as plain dicts"""
+    return [dict(row) for row in result.mappings()]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, Date, JSON
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, Date, JSON, LargeBinary, Index, and_
 from sqlalchemy.sql import func
 from app.database import Base
 import uuid
@@ -6,6 +6,13 @@ import uuid
 def generate_uuid():
     return str(uuid.uuid4())
 
+def partial_index(name, *columns, where):
+    """Index restricted to the rows matching `where` (partial index on Postgres and SQLite).
+
+    `where` should be written exactly like the routers' filter so the planner can match it.
+    """
+    return Index(name, *columns, postgresql_where=where, sqlite_where=where)
+
 class Skill(Base):
     __tablename__ = "skills"
     
@@ -20,6 +27,10 @@ class Skill(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        partial_index("ix_skills_active_display_order", display_order, where=is_active == True),
+    )
+
 class Project(Base):
     __tablename__ = "projects"
     
@@ -32,6 +43,8 @@ class Project(Base):
     short_description_fr = Column(String(500))
     image_url = Column(String(500))
     video_url = Column(String(500))
+    video_poster_url = Column(String(500))  # set by the video pipeline
+    video_duration = Column(Float)  # in seconds, set by the video pipeline
     gallery_urls = Column(JSON)
     project_url = Column(String(500))
     github_url = Column(String(500))
@@ -45,6 +58,11 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        partial_index("ix_projects_active_display_order", display_order, where=is_active == True),
+        partial_index("ix_projects_featured_display_order", display_order, where=and_(is_active == True, is_featured == True)),
+    )
+
 class WorkExperience(Base):
     __tablename__ = "work_experience"
     
@@ -68,6 +86,10 @@ class WorkExperience(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        partial_index("ix_work_experience_active_start_date", start_date.desc(), where=is_active == True),
+    )
+
 class Education(Base):
     __tablename__ = "education"
     
@@ -92,6 +114,10 @@ class Education(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        partial_index("ix_education_active_start_date", start_date.desc(), where=is_active == True),
+    )
+
 class ContactMessage(Base):
     __tablename__ = "contact_messages"
     
@@ -103,6 +129,10 @@ class ContactMessage(Base):
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_contact_messages_created_at_id", created_at.desc(), id.desc()),
+    )
+
 class Admin(Base):
     __tablename__ = "admins"
     
@@ -131,6 +161,10 @@ class Hobby(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        partial_index("ix_hobbies_active_display_order", display_order, where=is_active == True),
+    )
+
 class Resume(Base):
     __tablename__ = "resumes"
     
@@ -145,6 +179,10 @@ class Resume(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_resumes_language_is_active", language, is_active),
+    )
+
 class Testimonial(Base):
     __tablename__ = "testimonials"
     
@@ -163,3 +201,47 @@ class Testimonial(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     reviewed_at = Column(DateTime(timezone=True))
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        partial_index(
+            "ix_testimonials_approved_display_order", display_order, created_at.desc(),
+            where=status == 'approved'
+        ),
+        Index("ix_testimonials_status_created_at", status, created_at.desc()),
+        Index("ix_testimonials_created_at_id", created_at.desc(), id.desc()),
+    )
+
+class ResumableUpload(Base):
+    __tablename__ = "resumable_uploads"
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    filename = Column(String(300), nullable=False)  # object name in the bucket
+    original_filename = Column(String(300))
+    content_type = Column(String(100))
+    size = Column(Integer, nullable=False)  # in bytes
+    offset = Column(Integer, default=0)  # bytes stored so far
+    upstream_url = Column(String(500), nullable=False)  # Supabase TUS upload URL
+    upload_token = Column(String(1000))  # signed upload token the client sends the chunks with
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True))
+
+class StoredFile(Base):
+    """Content-addressed index of uploads: identical bytes are stored once"""
+    __tablename__ = "stored_files"
+
+    sha256 = Column(String(64), primary_key=True)
+    filename = Column(String(300), nullable=False)  # object name in the bucket
+    url = Column(String(500), nullable=False)
+    size = Column(Integer)  # in bytes
+    content_type = Column(String(100))
+    original_filename = Column(String(300))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class PortfolioSnapshot(Base):
+    """Rendered /api/portfolio response per language, rebuilt in the same transaction as every write"""
+    __tablename__ = "portfolio_snapshot"
+
+    lang = Column(String(8), primary_key=True)  # "en", "fr", or "" for both languages
+    etag = Column(String(40), nullable=False)
+    body = Column(LargeBinary, nullable=False)  # JSON, exactly as served
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
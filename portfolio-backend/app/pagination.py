@@ -0,0 +1,104 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import DateTime, String, cast, func, literal, select, text, tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def limit_query():
+    """Bounded `limit` query parameter for paginated routes"""
+    return Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+
+
+def encode_cursor(values) -> str:
+    raw = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if len(values) != len(keys):
+            raise ValueError("wrong number of values")
+        return [
+            datetime.fromisoformat(value) if isinstance(key.type, DateTime) else value
+            for key, value in zip(keys, values)
+        ]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+# SQLite keeps datetimes as text: 'YYYY-MM-DD HH:MM:SS' from CURRENT_TIMESTAMP defaults,
+# 'YYYY-MM-DD HH:MM:SS.ffffff' when SQLAlchemy writes them. Padded to the second form, they
+# sort and compare in time order, down to the microsecond.
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def _sort_key(db, key):
+    if isinstance(key.type, DateTime) and db.bind.dialect.name == "sqlite":
+        return func.substr(cast(key, String) + ".000000", 1, 26)
+    return key
+
+
+def _bind(db, key, value):
+    if isinstance(key.type, DateTime) and db.bind.dialect.name == "sqlite":
+        return literal(value.strftime(SQLITE_DATETIME_FORMAT))
+    return literal(value, key.type)
+
+
+async def _estimate_total(db, query, table, filtered: bool):
+    if not filtered and db.bind.dialect.name == "postgresql":
+        # Planner statistics: free, and close enough for an inbox counter
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"), {"table": table.name}
+        )
+        estimate = result.scalar()
+        if estimate is not None and estimate >= 0:
+            return estimate
+    result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    return result.scalar()
+
+
+class Page:
+    def __init__(self, items, next_cursor: Optional[str] = None, total_estimate: Optional[int] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total_estimate = total_estimate
+
+    def apply_headers(self, response: Response):
+        """Expose the cursor/total as headers so the body stays a plain list"""
+        if self.next_cursor:
+            response.headers["X-Next-Cursor"] = self.next_cursor
+        if self.total_estimate is not None:
+            response.headers["X-Total-Estimate"] = str(self.total_estimate)
+
+
+async def paginate(db, query, keys, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                   with_total: bool = False, filtered: bool = False, offset: int = 0) -> Page:
+    """Keyset (seek) pagination of `query`, newest first on `keys` (e.g. created_at, id).
+
+    `keys` must be unique together, and covered by an index for the seek to be cheap.
+    The cursor is opaque to clients: the key values of the last row, base64-encoded.
+    `offset` only applies without a cursor, for clients still paging with ?skip=.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    total = await _estimate_total(db, query, keys[0].table, filtered) if with_total else None
+    sort_keys = [_sort_key(db, key) for key in keys]
+
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        query = query.filter(tuple_(*sort_keys) < tuple_(*(_bind(db, key, value) for key, value in zip(keys, values))))
+    elif offset:
+        query = query.offset(offset)
+    result = await db.execute(query.order_by(*(key.desc() for key in sort_keys)).limit(limit + 1))
+    items = result.scalars().all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys])
+    return Page(items, next_cursor, total)
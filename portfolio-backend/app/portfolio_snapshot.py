@@ -0,0 +1,159 @@
+import hashlib
+import logging
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.database import AsyncSessionLocal, Base
+from app.localization import LANGUAGES, localize_rows, localized_select, localized_rows
+from app.models import Skill, Project, WorkExperience, Education, Hobby, Testimonial, Resume, PortfolioSnapshot
+from app.schemas import PortfolioResponse, PortfolioLocalizedResponse
+from app.serialization import ResponseAdapter
+
+logger = logging.getLogger("portfolio_snapshot")
+
+PORTFOLIO = ResponseAdapter(PortfolioResponse, PortfolioLocalizedResponse)
+SNAPSHOT_LANGS = ("", *LANGUAGES)  # "" is the response without ?lang
+
+# Same filters/ordering as the public list endpoint of each router
+PUBLIC_SECTIONS = {
+    "skills": lambda: localized_select(Skill).filter(
+        Skill.is_active == True
+    ).order_by(Skill.display_order),
+    "projects": lambda: localized_select(Project).filter(
+        Project.is_active == True
+    ).order_by(Project.display_order),
+    "work_experience": lambda: localized_select(WorkExperience).filter(
+        WorkExperience.is_active == True
+    ).order_by(WorkExperience.start_date.desc()),
+    "education": lambda: localized_select(Education).filter(
+        Education.is_active == True
+    ).order_by(Education.start_date.desc()),
+    "hobbies": lambda: localized_select(Hobby).filter(
+        Hobby.is_active == True
+    ).order_by(Hobby.display_order).limit(100),
+    "testimonials": lambda: localized_select(Testimonial).filter(
+        Testimonial.status == 'approved'
+    ).order_by(Testimonial.display_order, Testimonial.created_at.desc()).limit(100),
+    "resumes": lambda: localized_select(Resume).filter(
+        Resume.is_active == True
+    ).limit(100),
+}
+
+
+def render_portfolios(connection, langs=SNAPSHOT_LANGS):
+    """The /api/portfolio body of each of `langs`, from the sections' current rows.
+
+    Each section is selected once, with both languages' columns, and projected onto
+    each language in Python: one query per section, however many languages.
+    """
+    rows = {name: localized_rows(connection.execute(section())) for name, section in PUBLIC_SECTIONS.items()}
+    bodies = {}
+    for lang in langs:
+        sections = {
+            name: localize_rows(Base.metadata.tables[name], section_rows, lang) if lang else section_rows
+            for name, section_rows in rows.items()
+        }
+        bodies[lang] = PORTFOLIO.response(sections, lang or None).body
+    return bodies
+
+
+def render_portfolio(connection, lang: str = "") -> bytes:
+    """The /api/portfolio body for `lang`"""
+    return render_portfolios(connection, (lang,))[lang]
+
+
+def snapshot_etag(body: bytes) -> str:
+    return '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+def _upsert(connection):
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(PortfolioSnapshot)
+
+
+def build_snapshots(connection):
+    """Render and store the payload of every language, inside `connection`'s transaction.
+
+    Sync (a Connection, e.g. `session.connection()`), so it can run from the commit hook.
+    Rebuilders are serialized by locking the existing rows first, so a concurrent write
+    can't store a payload rendered before ours committed.
+    """
+    connection.execute(select(PortfolioSnapshot.lang).with_for_update())
+    snapshots = {
+        lang: {"lang": lang, "etag": snapshot_etag(body), "body": body}
+        for lang, body in render_portfolios(connection).items()
+    }
+    statement = _upsert(connection)
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[PortfolioSnapshot.lang],
+        set_={"etag": statement.excluded.etag, "body": statement.excluded.body, "updated_at": statement.excluded.updated_at},
+    ), list(snapshots.values()))
+    return snapshots
+
+
+async def load_snapshot(db, lang: str = ""):
+    """(etag, body) of the stored payload: one primary-key read.
+
+    When it's missing (a database that hasn't been written to through the API yet) it's
+    built and stored through the primary, since `db` may be a read-only replica; if
+    that fails too, it's rendered from `db` without being stored.
+    """
+    result = await db.execute(
+        select(PortfolioSnapshot.etag, PortfolioSnapshot.body).where(PortfolioSnapshot.lang == lang)
+    )
+    row = result.first()
+    if row is not None:
+        return row
+    try:
+        async with AsyncSessionLocal() as primary:
+            snapshots = await primary.run_sync(lambda session: build_snapshots(session.connection()))
+            await primary.commit()
+        return snapshots[lang]["etag"], snapshots[lang]["body"]
+    except Exception as e:
+        logger.warning(f"Could not store the portfolio snapshot, rendering it from the replica: {e}")
+        body = await db.run_sync(lambda session: render_portfolio(session.connection(), lang))
+        return snapshot_etag(body), body
+
+
+# Commit hook: any session whose transaction changed a public section rebuilds the
+# snapshot before committing, so the stored payload never disagrees with the tables.
+
+def _changed_sections(session):
+    return session.info.setdefault("portfolio_sections", set())
+
+
+def _hidden(instance):
+    # A new row the public filters leave out (e.g. a pending testimonial) changes no section
+    return getattr(instance, "status", "approved") != "approved" or getattr(instance, "is_active", True) is False
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    new = [instance for instance in session.new if not _hidden(instance)]
+    for instance in (*new, *session.dirty, *session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table in PUBLIC_SECTIONS:
+            _changed_sections(session).add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state):
+    # update()/delete() ... RETURNING from app.crud don't go through a flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = orm_execute_state.statement.table.name
+        if table in PUBLIC_SECTIONS:
+            _changed_sections(orm_execute_state.session).add(table)
+
+
+@event.listens_for(Session, "before_commit")
+def _rebuild_before_commit(session):
+    session.flush()  # pending adds only reach _track_flush here
+    if session.info.pop("portfolio_sections", None):
+        build_snapshots(session.connection())
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changes(session):
+    session.info.pop("portfolio_sections", None)
@@ -0,0 +1,139 @@
+import os
+import time
+import sqlite3
+import asyncio
+import logging
+import tempfile
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.cache import cache
+from app.database import Base, async_engine, SQLITE_REPLICA_PATH
+from app.portfolio_snapshot import PUBLIC_SECTIONS
+
+logger = logging.getLogger("replica")
+
+REPLICA_TABLES = (*PUBLIC_SECTIONS, "portfolio_snapshot")
+# How often a public read checks the primary for changes made through other instances
+SQLITE_REPLICA_MAX_AGE = float(os.getenv("SQLITE_REPLICA_MAX_AGE", "60"))
+# The deployment bundle is read-only: refreshed copies go to the instance's temp dir
+WORKING_COPY = os.path.join(tempfile.gettempdir(), "portfolio-replica.db")
+
+
+def dump_tables(connection):
+    """Every row of the replicated tables, read from the primary (sync; run_sync from async code)"""
+    return {
+        name: [dict(row) for row in connection.execute(select(Base.metadata.tables[name])).mappings()]
+        for name in REPLICA_TABLES
+    }
+
+
+def write_replica(path: str, dump):
+    """Write `dump` into a fresh SQLite file (schema and indexes included), then swap it into place.
+
+    os.replace is atomic, so readers see either the old file or the new one, never half of it.
+    """
+    staging = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(staging):
+        os.remove(staging)
+    engine = create_engine(f"sqlite:///{staging}")
+    try:
+        Base.metadata.create_all(engine, tables=[Base.metadata.tables[name] for name in REPLICA_TABLES])
+        with engine.begin() as conn:
+            for name, rows in dump.items():
+                if rows:
+                    conn.execute(Base.metadata.tables[name].insert(), rows)
+    finally:
+        engine.dispose()
+    os.replace(staging, path)
+
+
+def _snapshot_etags_of(path: str):
+    # The portfolio_snapshot ETags change with any public content: a cheap "is it current?" check
+    with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+        return dict(conn.execute("SELECT lang, etag FROM portfolio_snapshot").fetchall())
+
+
+def _primary_snapshot_etags(connection):
+    table = Base.metadata.tables["portfolio_snapshot"]
+    return dict(connection.execute(select(table.c.lang, table.c.etag)).all())
+
+
+class SQLiteReplica:
+    """Read-only SQLite copy of the public tables that the public GET routes read from.
+
+    Starts from the file bundled with the deployment, is rebuilt from the primary after
+    writes made on this instance (app.cache.invalidate) and, at most every
+    SQLITE_REPLICA_MAX_AGE seconds, in the background when the primary has changed. A
+    refresh that fails (primary unreachable) keeps the last good copy in service.
+    """
+
+    def __init__(self, bundle_path: str):
+        self.bundle_path = bundle_path
+        self._sessionmaker = None
+        self._engine = None
+        self._checked_at = 0  # check the bundled copy against the primary on first use
+        self._lock = None
+        self._background = None
+
+    def current_path(self):
+        for path in (WORKING_COPY, self.bundle_path):
+            if path and os.path.exists(path):
+                return path
+        return None
+
+    async def sessionmaker(self):
+        if self.current_path() is None:
+            # Nothing bundled: build the first copy now
+            if not await self.refresh():
+                raise RuntimeError("No SQLite replica to read from and the primary is unreachable")
+        elif time.monotonic() - self._checked_at > SQLITE_REPLICA_MAX_AGE and not self._background:
+            self._checked_at = time.monotonic()
+            self._background = asyncio.create_task(self.refresh(only_if_changed=True))
+            self._background.add_done_callback(lambda _: setattr(self, "_background", None))
+        if self._sessionmaker is None:
+            self._engine = create_async_engine(f"sqlite+aiosqlite:///file:{self.current_path()}?mode=ro&uri=true")
+            self._sessionmaker = async_sessionmaker(self._engine, autoflush=False, expire_on_commit=False)
+        return self._sessionmaker
+
+    async def refresh(self, only_if_changed: bool = False) -> bool:
+        """Rebuild the working copy from the primary; returns whether it was replaced"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            try:
+                async with async_engine.connect() as conn:
+                    current = self.current_path()
+                    if only_if_changed and current and (
+                        await conn.run_sync(_primary_snapshot_etags) == _snapshot_etags_of(current)
+                    ):
+                        return False
+                    dump = await conn.run_sync(dump_tables)
+                await asyncio.to_thread(write_replica, WORKING_COPY, dump)
+            except Exception as e:
+                logger.warning(f"Replica refresh failed, still serving the last good copy: {e}")
+                return False
+            self._checked_at = time.monotonic()
+            if self._engine is not None:
+                # New connections open the new file; sessions still reading keep the old one
+                await self._engine.dispose()
+                self._engine = self._sessionmaker = None
+            # Cached responses and ETag versions came from the previous copy
+            cache.invalidate(*REPLICA_TABLES)
+            logger.info(f"Replica refreshed ({sum(len(rows) for rows in dump.values())} rows)")
+            return True
+
+
+def _bundle_path():
+    if not SQLITE_REPLICA_PATH or os.path.isabs(SQLITE_REPLICA_PATH):
+        return SQLITE_REPLICA_PATH
+    # Relative to portfolio-backend/, wherever the function is started from
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), SQLITE_REPLICA_PATH)
+
+
+replica = SQLiteReplica(_bundle_path())
+
+
+async def refresh_replica():
+    """Write hook: bring this instance's replica up to date with a write it just committed"""
+    if SQLITE_REPLICA_PATH:
+        await replica.refresh()
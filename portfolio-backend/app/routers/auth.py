@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from app.auth import get_current_user, supabase
+from app.auth import get_current_user, get_supabase
 
 router = APIRouter()
 
@@ -16,6 +16,7 @@ class LoginResponse(BaseModel):
 @router.post("/login", response_model=LoginResponse)
 async def login(credentials: LoginRequest):
     """Login with Supabase authentication"""
+    supabase = get_supabase()
     if not supabase:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -55,6 +56,7 @@ async def login(credentials: LoginRequest):
 @router.post("/register")
 async def register(credentials: LoginRequest):
     """Register a new admin user with Supabase"""
+    supabase = get_supabase()
     if not supabase:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -1,20 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from app.database import get_db
+from app.crud import update_by_id, delete_by_id
 from app.models import ContactMessage, Admin
 from app.schemas import ContactMessageCreate, ContactMessageResponse
 from app.auth import get_current_active_admin
+from app.pagination import paginate, limit_query
 
 router = APIRouter()
 
 @router.post("/send", status_code=201)
-async def send_contact_message(message: ContactMessageCreate, db: Session = Depends(get_db)):
+async def send_contact_message(message: ContactMessageCreate, db: AsyncSession = Depends(get_db)):
     """Receive a contact message from the frontend"""
     db_message = ContactMessage(**message.dict())
     db.add(db_message)
-    db.commit()
-    db.refresh(db_message)
+    await db.commit()
     return {
         "success": True,
         "message": "Message sent successfully",
@@ -23,21 +25,32 @@ async def send_contact_message(message: ContactMessageCreate, db: Session = Depe
 
 @router.get("", response_model=List[ContactMessageResponse])
 async def get_contact_messages(
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = limit_query(),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
-    """Get all contact messages (admin only)"""
-    messages = db.query(ContactMessage).order_by(ContactMessage.created_at.desc()).all()
-    return messages
+    """Get contact messages, newest first (admin only).
+
+    Pass the X-Next-Cursor response header back as `cursor` to get the next page.
+    """
+    page = await paginate(
+        db, select(ContactMessage), (ContactMessage.created_at, ContactMessage.id),
+        cursor=cursor, limit=limit, with_total=include_total
+    )
+    page.apply_headers(response)
+    return page.items
 
 @router.get("/{message_id}", response_model=ContactMessageResponse)
 async def get_contact_message(
     message_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Get a specific contact message by ID (admin only)"""
-    message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
+    message = await db.get(ContactMessage, message_id)
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
     return message
@@ -45,29 +58,19 @@ async def get_contact_message(
 @router.patch("/{message_id}/read")
 async def mark_message_as_read(
     message_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Mark a contact message as read (admin only)"""
-    message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-    if not message:
-        raise HTTPException(status_code=404, detail="Message not found")
-    
-    message.is_read = True
-    db.commit()
+    await update_by_id(db, ContactMessage, message_id, {"is_read": True}, "Message not found")
     return {"success": True, "message": "Message marked as read"}
 
 @router.delete("/{message_id}")
 async def delete_contact_message(
     message_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Delete a contact message"""
-    message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-    if not message:
-        raise HTTPException(status_code=404, detail="Message not found")
-    
-    db.delete(message)
-    db.commit()
+    await delete_by_id(db, ContactMessage, message_id, "Message not found")
     return {"success": True, "message": "Message deleted successfully"}
@@ -1,25 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Education
-from app.schemas import EducationCreate, EducationResponse
+from app.schemas import EducationCreate, EducationResponse, EducationLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_user
 
 router = APIRouter()
 
-@router.get("", response_model=List[EducationResponse])
-async def get_education(db: Session = Depends(get_db)):
+EDUCATION_LIST = ResponseAdapter(List[EducationResponse], List[EducationLocalizedResponse])
+
+@router.get("", response_model=Union[List[EducationResponse], List[EducationLocalizedResponse]])
+@cached("education")
+async def get_education(lang: Optional[str] = lang_query(), db: AsyncSession = Depends(get_read_db)):
     """Get all active education records ordered by start_date (most recent first)"""
-    education = db.query(Education).filter(
-        Education.is_active == True
-    ).order_by(Education.start_date.desc()).all()
-    return education
+    result = await db.execute(
+        localized_select(Education, lang).filter(
+            Education.is_active == True
+        ).order_by(Education.start_date.desc())
+    )
+    return EDUCATION_LIST.response(localized_rows(result), lang)
 
 @router.get("/{education_id}", response_model=EducationResponse)
-async def get_education_by_id(education_id: str, db: Session = Depends(get_db)):
+async def get_education_by_id(education_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific education record by ID"""
-    education = db.query(Education).filter(Education.id == education_id).first()
+    education = await db.get(Education, education_id)
     if not education:
         raise HTTPException(status_code=404, detail="Education record not found")
     return education
@@ -27,46 +36,36 @@ async def get_education_by_id(education_id: str, db: Session = Depends(get_db)):
 @router.post("", response_model=EducationResponse, status_code=201)
 async def create_education(
     education: EducationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new education record (admin only)"""
     db_education = Education(**education.dict())
     db.add(db_education)
-    db.commit()
-    db.refresh(db_education)
+    await db.commit()
+    await invalidate("education")
+    await db.refresh(db_education)
     return db_education
 
 @router.put("/{education_id}", response_model=EducationResponse)
 async def update_education(
     education_id: str,
     education: EducationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Update an existing education record (admin only)"""
-    db_education = db.query(Education).filter(Education.id == education_id).first()
-    if not db_education:
-        raise HTTPException(status_code=404, detail="Education record not found")
-    
-    for key, value in education.dict(exclude_unset=True).items():
-        setattr(db_education, key, value)
-    
-    db.commit()
-    db.refresh(db_education)
+    db_education = await update_by_id(db, Education, education_id, education.dict(exclude_unset=True), "Education record not found")
+    await invalidate("education")
     return db_education
 
 @router.delete("/{education_id}")
 async def delete_education(
     education_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Delete an education record (admin only)"""
-    db_education = db.query(Education).filter(Education.id == education_id).first()
-    if not db_education:
-        raise HTTPException(status_code=404, detail="Education record not found")
-    
-    db.delete(db_education)
-    db.commit()
+    await delete_by_id(db, Education, education_id, "Education record not found")
+    await invalidate("education")
     return {"success": True, "message": "Education record deleted successfully"}
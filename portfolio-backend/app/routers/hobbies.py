@@ -1,31 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Hobby, Admin
-from app.schemas import HobbyCreate, HobbyUpdate, HobbyResponse
+from app.schemas import HobbyCreate, HobbyUpdate, HobbyResponse, HobbyLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_active_admin
 
 router = APIRouter()
 
-@router.get("/", response_model=List[HobbyResponse])
+HOBBY_LIST = ResponseAdapter(List[HobbyResponse], List[HobbyLocalizedResponse])
+
+@router.get("/", response_model=Union[List[HobbyResponse], List[HobbyLocalizedResponse]])
+@cached("hobbies")
 async def get_hobbies(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
-    db: Session = Depends(get_db)
+    lang: Optional[str] = lang_query(),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all hobbies (public endpoint)"""
-    query = db.query(Hobby)
+    query = localized_select(Hobby, lang)
     if active_only:
         query = query.filter(Hobby.is_active == True)
-    hobbies = query.order_by(Hobby.display_order).offset(skip).limit(limit).all()
-    return hobbies
+    result = await db.execute(query.order_by(Hobby.display_order).offset(skip).limit(limit))
+    return HOBBY_LIST.response(localized_rows(result), lang)
 
 @router.get("/{hobby_id}", response_model=HobbyResponse)
-async def get_hobby(hobby_id: str, db: Session = Depends(get_db)):
+async def get_hobby(hobby_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific hobby by ID"""
-    hobby = db.query(Hobby).filter(Hobby.id == hobby_id).first()
+    hobby = await db.get(Hobby, hobby_id)
     if not hobby:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hobby not found")
     return hobby
@@ -33,46 +41,36 @@ async def get_hobby(hobby_id: str, db: Session = Depends(get_db)):
 @router.post("/", response_model=HobbyResponse, status_code=status.HTTP_201_CREATED)
 async def create_hobby(
     hobby: HobbyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Create a new hobby (admin only)"""
     db_hobby = Hobby(**hobby.dict())
     db.add(db_hobby)
-    db.commit()
-    db.refresh(db_hobby)
+    await db.commit()
+    await invalidate("hobbies")
+    await db.refresh(db_hobby)
     return db_hobby
 
 @router.put("/{hobby_id}", response_model=HobbyResponse)
 async def update_hobby(
     hobby_id: str,
     hobby: HobbyUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Update a hobby (admin only)"""
-    db_hobby = db.query(Hobby).filter(Hobby.id == hobby_id).first()
-    if not db_hobby:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hobby not found")
-    
-    for key, value in hobby.dict(exclude_unset=True).items():
-        setattr(db_hobby, key, value)
-    
-    db.commit()
-    db.refresh(db_hobby)
+    db_hobby = await update_by_id(db, Hobby, hobby_id, hobby.dict(exclude_unset=True), "Hobby not found")
+    await invalidate("hobbies")
     return db_hobby
 
 @router.delete("/{hobby_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_hobby(
     hobby_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Delete a hobby (admin only)"""
-    db_hobby = db.query(Hobby).filter(Hobby.id == hobby_id).first()
-    if not db_hobby:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hobby not found")
-    
-    db.delete(db_hobby)
-    db.commit()
+    await delete_by_id(db, Hobby, hobby_id, "Hobby not found")
+    await invalidate("hobbies")
     return None
@@ -0,0 +1,37 @@
+from typing import Optional, Union
+from fastapi import APIRouter, Request, Response
+from app.auth import is_admin_request
+from app.database import read_sessionmaker
+from app.cache import cache, encoded_response, not_modified
+from app.localization import lang_query
+from app.portfolio_snapshot import PUBLIC_SECTIONS, load_snapshot
+from app.schemas import PortfolioResponse, PortfolioLocalizedResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=Union[PortfolioResponse, PortfolioLocalizedResponse])
+async def get_portfolio(request: Request, lang: Optional[str] = lang_query()):
+    """Get every public portfolio section in one response.
+
+    Served from the portfolio_snapshot row of the language (rebuilt with every write), so
+    a cold instance needs a single primary-key read rather than a query per section.
+    """
+    key = ("portfolio_snapshot", lang or "")
+    # Admins read the primary (see read_sessionmaker), past this instance's cache
+    admin = await is_admin_request(request)
+    snapshot = None if admin else cache.get(key, None)
+    if snapshot is None:
+        async with (await read_sessionmaker(request))() as db:
+            snapshot = await load_snapshot(db, lang or "")
+        if not admin:
+            cache.set(key, snapshot, PUBLIC_SECTIONS)
+    etag, body = snapshot
+    if admin:
+        return Response(body, media_type="application/json")
+
+    unchanged = not_modified(request.headers.get("if-none-match"), etag, PUBLIC_SECTIONS)
+    if unchanged:
+        return unchanged
+    return encoded_response(key, Response(body, media_type="application/json"), PUBLIC_SECTIONS, etag,
+                            request.headers.get("accept-encoding"))
@@ -1,32 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import case
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Project
-from app.schemas import ProjectCreate, ProjectResponse
+from app.schemas import ProjectCreate, ProjectResponse, ProjectLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_user
+from app.storage import storage
+from app.videos import needs_processing, process_project_video
 
 router = APIRouter()
 
-@router.get("", response_model=List[ProjectResponse])
-async def get_projects(db: Session = Depends(get_db)):
+PROJECT_LIST = ResponseAdapter(List[ProjectResponse], List[ProjectLocalizedResponse])
+
+def _schedule_video(background_tasks: BackgroundTasks, project: Project):
+    """Queue the fast-start/poster/duration job for a freshly uploaded project video"""
+    supabase_url, _ = storage.credentials()
+    if needs_processing(project.video_url, supabase_url):
+        background_tasks.add_task(process_project_video, project.id, project.video_url)
+
+@router.get("", response_model=Union[List[ProjectResponse], List[ProjectLocalizedResponse]])
+@cached("projects")
+async def get_projects(lang: Optional[str] = lang_query(), db: AsyncSession = Depends(get_read_db)):
     """Get all active projects ordered by display_order"""
-    projects = db.query(Project).filter(Project.is_active == True).order_by(Project.display_order).all()
-    return projects
+    result = await db.execute(
+        localized_select(Project, lang).filter(Project.is_active == True).order_by(Project.display_order)
+    )
+    return PROJECT_LIST.response(localized_rows(result), lang)
 
-@router.get("/featured", response_model=List[ProjectResponse])
-async def get_featured_projects(db: Session = Depends(get_db)):
+@router.get("/featured", response_model=Union[List[ProjectResponse], List[ProjectLocalizedResponse]])
+@cached("projects")
+async def get_featured_projects(lang: Optional[str] = lang_query(), db: AsyncSession = Depends(get_read_db)):
     """Get featured projects"""
-    projects = db.query(Project).filter(
-        Project.is_active == True,
-        Project.is_featured == True
-    ).order_by(Project.display_order).all()
-    return projects
+    result = await db.execute(
+        localized_select(Project, lang).filter(
+            Project.is_active == True,
+            Project.is_featured == True
+        ).order_by(Project.display_order)
+    )
+    return PROJECT_LIST.response(localized_rows(result), lang)
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: str, db: Session = Depends(get_db)):
+async def get_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific project by ID"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -34,46 +55,48 @@ async def get_project(project_id: str, db: Session = Depends(get_db)):
 @router.post("", response_model=ProjectResponse, status_code=201)
 async def create_project(
     project: ProjectCreate,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new project (admin only)"""
     db_project = Project(**project.dict())
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await invalidate("projects")
+    await db.refresh(db_project)
+    _schedule_video(background_tasks, db_project)
     return db_project
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: str,
     project: ProjectCreate,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Update an existing project (admin only)"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    for key, value in project.dict(exclude_unset=True).items():
-        setattr(db_project, key, value)
-    
-    db.commit()
-    db.refresh(db_project)
+    updates = project.dict(exclude_unset=True)
+    if "video_url" in updates:
+        # A new video drops the poster/duration of the previous one (SET sees the old row)
+        video_changed = Project.video_url.is_distinct_from(updates["video_url"])
+        updates["video_poster_url"] = case((video_changed, None), else_=Project.video_poster_url)
+        updates["video_duration"] = case((video_changed, None), else_=Project.video_duration)
+    db_project = await update_by_id(db, Project, project_id, updates, "Project not found")
+    await invalidate("projects")
+    if db_project.video_poster_url is None:
+        # Raw uploads only: processed videos aren't picked up again
+        _schedule_video(background_tasks, db_project)
     return db_project
 
 @router.delete("/{project_id}")
 async def delete_project(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Delete a project (admin only)"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    db.delete(db_project)
-    db.commit()
+    await delete_by_id(db, Project, project_id, "Project not found")
+    await invalidate("projects")
     return {"success": True, "message": "Project deleted successfully"}
@@ -1,48 +1,61 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Resume, Admin
-from app.schemas import ResumeCreate, ResumeUpdate, ResumeResponse
+from app.schemas import ResumeCreate, ResumeUpdate, ResumeResponse, ResumeLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_active_admin
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ResumeResponse])
+RESUME_LIST = ResponseAdapter(List[ResumeResponse], List[ResumeLocalizedResponse])
+RESUME = ResponseAdapter(ResumeResponse)
+
+@router.get("/", response_model=Union[List[ResumeResponse], List[ResumeLocalizedResponse]])
+@cached("resumes")
 async def get_resumes(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
     language: str = None,
-    db: Session = Depends(get_db)
+    lang: Optional[str] = lang_query(),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all resumes (public endpoint)"""
-    query = db.query(Resume)
+    query = localized_select(Resume, lang)
     if active_only:
         query = query.filter(Resume.is_active == True)
     if language:
         query = query.filter(Resume.language == language)
-    resumes = query.offset(skip).limit(limit).all()
-    return resumes
+    result = await db.execute(query.offset(skip).limit(limit))
+    return RESUME_LIST.response(localized_rows(result), lang)
 
 @router.get("/active/{language}", response_model=ResumeResponse)
-async def get_active_resume(language: str, db: Session = Depends(get_db)):
+@cached("resumes")
+async def get_active_resume(language: str, db: AsyncSession = Depends(get_read_db)):
     """Get the active resume for a specific language"""
-    resume = db.query(Resume).filter(
-        Resume.language == language,
-        Resume.is_active == True
-    ).first()
-    if not resume:
+    result = await db.execute(
+        localized_select(Resume).filter(
+            Resume.language == language,
+            Resume.is_active == True
+        ).limit(1)
+    )
+    resumes = localized_rows(result)
+    if not resumes:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No active resume found for language: {language}"
         )
-    return resume
+    return RESUME.response(resumes[0])
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-async def get_resume(resume_id: str, db: Session = Depends(get_db)):
+async def get_resume(resume_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific resume by ID"""
-    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    resume = await db.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     return resume
@@ -50,46 +63,36 @@ async def get_resume(resume_id: str, db: Session = Depends(get_db)):
 @router.post("/", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def create_resume(
     resume: ResumeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Create a new resume (admin only)"""
     db_resume = Resume(**resume.dict())
     db.add(db_resume)
-    db.commit()
-    db.refresh(db_resume)
+    await db.commit()
+    await invalidate("resumes")
+    await db.refresh(db_resume)
     return db_resume
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
 async def update_resume(
     resume_id: str,
     resume: ResumeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Update a resume (admin only)"""
-    db_resume = db.query(Resume).filter(Resume.id == resume_id).first()
-    if not db_resume:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    
-    for key, value in resume.dict(exclude_unset=True).items():
-        setattr(db_resume, key, value)
-    
-    db.commit()
-    db.refresh(db_resume)
+    db_resume = await update_by_id(db, Resume, resume_id, resume.dict(exclude_unset=True), "Resume not found")
+    await invalidate("resumes")
     return db_resume
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_resume(
     resume_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Delete a resume (admin only)"""
-    db_resume = db.query(Resume).filter(Resume.id == resume_id).first()
-    if not db_resume:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    
-    db.delete(db_resume)
-    db.commit()
+    await delete_by_id(db, Resume, resume_id, "Resume not found")
+    await invalidate("resumes")
     return None
@@ -1,29 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Skill
-from app.schemas import SkillCreate, SkillResponse, SkillUpdate
+from app.schemas import SkillCreate, SkillResponse, SkillUpdate, SkillLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_user
 
 router = APIRouter()
 
-@router.get("", response_model=List[SkillResponse])
-async def get_skills(db: Session = Depends(get_db)):
+SKILL_LIST = ResponseAdapter(List[SkillResponse], List[SkillLocalizedResponse])
+
+@router.get("", response_model=Union[List[SkillResponse], List[SkillLocalizedResponse]])
+@cached("skills")
+async def get_skills(lang: Optional[str] = lang_query(), db: AsyncSession = Depends(get_read_db)):
     """Get all active skills ordered by display_order"""
-    skills = db.query(Skill).filter(Skill.is_active == True).order_by(Skill.display_order).all()
-    return skills
+    result = await db.execute(
+        localized_select(Skill, lang).filter(Skill.is_active == True).order_by(Skill.display_order)
+    )
+    return SKILL_LIST.response(localized_rows(result), lang)
 
 @router.get("/all", response_model=List[SkillResponse])
-async def get_all_skills(db: Session = Depends(get_db)):
+async def get_all_skills(db: AsyncSession = Depends(get_db)):
     """Get all skills including inactive ones"""
-    skills = db.query(Skill).order_by(Skill.display_order).all()
-    return skills
+    result = await db.execute(select(Skill).order_by(Skill.display_order))
+    return result.scalars().all()
 
 @router.get("/{skill_id}", response_model=SkillResponse)
-async def get_skill(skill_id: str, db: Session = Depends(get_db)):
+async def get_skill(skill_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific skill by ID"""
-    skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    skill = await db.get(Skill, skill_id)
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
     return skill
@@ -31,46 +41,36 @@ async def get_skill(skill_id: str, db: Session = Depends(get_db)):
 @router.post("", response_model=SkillResponse, status_code=201)
 async def create_skill(
     skill: SkillCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new skill (admin only)"""
     db_skill = Skill(**skill.dict())
     db.add(db_skill)
-    db.commit()
-    db.refresh(db_skill)
+    await db.commit()
+    await invalidate("skills")
+    await db.refresh(db_skill)
     return db_skill
 
 @router.put("/{skill_id}", response_model=SkillResponse)
 async def update_skill(
     skill_id: str,
     skill: SkillUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Update an existing skill (admin only)"""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
-    if not db_skill:
-        raise HTTPException(status_code=404, detail="Skill not found")
-    
-    for key, value in skill.dict(exclude_unset=True).items():
-        setattr(db_skill, key, value)
-    
-    db.commit()
-    db.refresh(db_skill)
+    db_skill = await update_by_id(db, Skill, skill_id, skill.dict(exclude_unset=True), "Skill not found")
+    await invalidate("skills")
     return db_skill
 
 @router.delete("/{skill_id}")
 async def delete_skill(
     skill_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Delete a skill (admin only)"""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
-    if not db_skill:
-        raise HTTPException(status_code=404, detail="Skill not found")
-    
-    db.delete(db_skill)
-    db.commit()
+    await delete_by_id(db, Skill, skill_id, "Skill not found")
+    await invalidate("skills")
     return {"success": True, "message": "Skill deleted successfully"}
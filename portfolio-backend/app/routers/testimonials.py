@@ -1,140 +1,150 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.crud import update_by_id, delete_by_id
+from app.cache import cached, invalidate
 from app.models import Testimonial, Admin
-from app.schemas import TestimonialCreate, TestimonialUpdate, TestimonialResponse, TestimonialPublicCreate
+from app.schemas import TestimonialCreate, TestimonialUpdate, TestimonialResponse, TestimonialPublicCreate, TestimonialLocalizedResponse
+from app.serialization import ResponseAdapter
+from app.localization import lang_query, localized_select, localized_rows
 from app.auth import get_current_active_admin
+from app.pagination import paginate, limit_query
 
 router = APIRouter()
 
-@router.get("/", response_model=List[TestimonialResponse])
+TESTIMONIAL_LIST = ResponseAdapter(List[TestimonialResponse], List[TestimonialLocalizedResponse])
+
+@router.get("/", response_model=Union[List[TestimonialResponse], List[TestimonialLocalizedResponse]])
+@cached("testimonials")
 async def get_testimonials(
     skip: int = 0,
     limit: int = 100,
     approved_only: bool = True,
-    db: Session = Depends(get_db)
+    lang: Optional[str] = lang_query(),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all testimonials (public endpoint - only shows approved by default)"""
-    query = db.query(Testimonial)
+    query = localized_select(Testimonial, lang)
     if approved_only:
         query = query.filter(Testimonial.status == 'approved')
-    testimonials = query.order_by(Testimonial.display_order, Testimonial.created_at.desc()).offset(skip).limit(limit).all()
-    return testimonials
+    result = await db.execute(
+        query.order_by(Testimonial.display_order, Testimonial.created_at.desc()).offset(skip).limit(limit)
+    )
+    return TESTIMONIAL_LIST.response(localized_rows(result), lang)
 
 @router.get("/admin/all", response_model=List[TestimonialResponse])
 async def get_all_testimonials_admin(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = limit_query(),
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset paging, for older clients: use `cursor`"),
     status_filter: str = None,
-    db: Session = Depends(get_db),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
-    """Get all testimonials including pending/rejected (admin only)"""
-    query = db.query(Testimonial)
+    """Get all testimonials including pending/rejected, newest first (admin only).
+
+    Pass the X-Next-Cursor response header back as `cursor` to get the next page.
+    """
+    query = select(Testimonial)
     if status_filter:
         query = query.filter(Testimonial.status == status_filter)
-    testimonials = query.order_by(Testimonial.created_at.desc()).offset(skip).limit(limit).all()
-    return testimonials
+    page = await paginate(
+        db, query, (Testimonial.created_at, Testimonial.id),
+        cursor=cursor, limit=limit, with_total=include_total, filtered=bool(status_filter), offset=skip
+    )
+    page.apply_headers(response)
+    return page.items
 
 @router.get("/{testimonial_id}", response_model=TestimonialResponse)
-async def get_testimonial(testimonial_id: str, db: Session = Depends(get_db)):
+async def get_testimonial(testimonial_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific testimonial by ID"""
-    testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
+    testimonial = await db.get(Testimonial, testimonial_id)
     if not testimonial:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Testimonial not found")
     return testimonial
 
 @router.post("/submit", response_model=TestimonialResponse, status_code=status.HTTP_201_CREATED)
-async def submit_testimonial(testimonial: TestimonialPublicCreate, db: Session = Depends(get_db)):
+async def submit_testimonial(testimonial: TestimonialPublicCreate, db: AsyncSession = Depends(get_db)):
     """Submit a new testimonial (public endpoint - will be pending approval)"""
     db_testimonial = Testimonial(
         **testimonial.dict(),
         status='pending'
     )
     db.add(db_testimonial)
-    db.commit()
-    db.refresh(db_testimonial)
+    await db.commit()
+    # Nothing public changed until an admin approves it: no cache, CDN or snapshot refresh here,
+    # so an anonymous client can't trigger them in a loop
+    await db.refresh(db_testimonial)
     return db_testimonial
 
 @router.post("/", response_model=TestimonialResponse, status_code=status.HTTP_201_CREATED)
 async def create_testimonial(
     testimonial: TestimonialCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Create a new testimonial (admin only)"""
     db_testimonial = Testimonial(**testimonial.dict())
     db.add(db_testimonial)
-    db.commit()
-    db.refresh(db_testimonial)
+    await db.commit()
+    await invalidate("testimonials")
+    await db.refresh(db_testimonial)
     return db_testimonial
 
 @router.put("/{testimonial_id}/approve", response_model=TestimonialResponse)
 async def approve_testimonial(
     testimonial_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Approve a testimonial (admin only)"""
-    testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
-    if not testimonial:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Testimonial not found")
-    
-    testimonial.status = 'approved'
-    testimonial.reviewed_at = datetime.utcnow()
-    db.commit()
-    db.refresh(testimonial)
+    testimonial = await update_by_id(
+        db, Testimonial, testimonial_id,
+        {"status": 'approved', "reviewed_at": datetime.utcnow()},
+        "Testimonial not found"
+    )
+    await invalidate("testimonials")
     return testimonial
 
 @router.put("/{testimonial_id}/reject", response_model=TestimonialResponse)
 async def reject_testimonial(
     testimonial_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Reject a testimonial (admin only)"""
-    testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
-    if not testimonial:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Testimonial not found")
-    
-    testimonial.status = 'rejected'
-    testimonial.reviewed_at = datetime.utcnow()
-    db.commit()
-    db.refresh(testimonial)
+    testimonial = await update_by_id(
+        db, Testimonial, testimonial_id,
+        {"status": 'rejected', "reviewed_at": datetime.utcnow()},
+        "Testimonial not found"
+    )
+    await invalidate("testimonials")
     return testimonial
 
 @router.put("/{testimonial_id}", response_model=TestimonialResponse)
 async def update_testimonial(
     testimonial_id: str,
     testimonial: TestimonialUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Update a testimonial (admin only)"""
-    db_testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
-    if not db_testimonial:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Testimonial not found")
-    
-    for key, value in testimonial.dict(exclude_unset=True).items():
-        setattr(db_testimonial, key, value)
-    
-    db.commit()
-    db.refresh(db_testimonial)
+    db_testimonial = await update_by_id(db, Testimonial, testimonial_id, testimonial.dict(exclude_unset=True), "Testimonial not found")
+    await invalidate("testimonials")
     return db_testimonial
 
 @router.delete("/{testimonial_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_testimonial(
     testimonial_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_active_admin)
 ):
     """Delete a testimonial (admin only)"""
-    db_testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
-    if not db_testimonial:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Testimonial not found")
-    
-    db.delete(db_testimonial)
-    db.commit()
+    await delete_by_id(db, Testimonial, testimonial_id, "Testimonial not found")
+    await invalidate("testimonials")
     return None
@@ -1,11 +1,25 @@
 import os
+import re
 import uuid
-import time
+import base64
+import hashlib
+import asyncio
 import logging
-import httpx
-import jwt as pyjwt
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from datetime import datetime
+from urllib.parse import parse_qs, urljoin, urlparse
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException, Response
+from sqlalchemy import String, cast, delete, func, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth import get_current_user
+from app.database import AsyncSessionLocal, get_db
+from app.models import (
+    ResumableUpload, StoredFile, Skill, Project, WorkExperience, Education, Hobby, Resume, Testimonial,
+)
+from app.schemas import SignedUploadRequest, FinalizeUploadRequest
+from app.storage import storage, storage_errors, STORAGE_BUCKET, IMMUTABLE_CACHE_CONTROL
+from app.images import wants_derivatives, manifest_name, stored_derivatives, process_image
 
 logger = logging.getLogger("upload")
 
@@ -17,104 +31,159 @@ ALLOWED_DOC_EXTENSIONS = {".pdf", ".doc", ".docx"}
 ALLOWED_EXTENSIONS = ALLOWED_IMAGE_EXTENSIONS | ALLOWED_VIDEO_EXTENSIONS | ALLOWED_DOC_EXTENSIONS
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB per read while streaming to storage
+MAX_BATCH_FILES = 50
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "6"))  # parallel uploads per batch
+SIGNED_UPLOAD_EXPIRES_IN = 2 * 60 * 60  # Supabase signed upload URLs are valid for 2 hours
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024  # Supabase's TUS endpoint takes 6 MB chunks (last one may be smaller), sent by the client
+TUS_VERSION = "1.0.0"
+CONTENT_ADDRESSED_NAME = re.compile(r"^([0-9a-f]{64})\.[a-z0-9]+$")  # <sha256><ext>
 
-# Supabase Storage bucket name
-STORAGE_BUCKET = "portfolio-files"
 
+class FileTooLarge(Exception):
+    pass
 
-def _get_supabase_config():
-    """
-    Get Supabase URL and a key that bypasses RLS for storage operations.
 
-    The SUPABASE_SERVICE_KEY may be in one of two formats:
-    1. A real service-role JWT (starts with 'eyJ') → use directly.
-    2. The JWT secret (e.g. 'sb_secret_...') → mint a short-lived service-role JWT.
-    Falls back to anon key (may hit RLS).
-    """
-    url = os.getenv("SUPABASE_URL", "").rstrip("/")
-    service_key = os.getenv("SUPABASE_SERVICE_KEY", "")
-    anon_key = os.getenv("SUPABASE_ANON_KEY", "")
+def _too_large():
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB.",
+    )
 
-    # 1) If service key is already a JWT, use it directly
-    if service_key.startswith("eyJ"):
-        return url, service_key
 
-    # 2) If it looks like a JWT secret (sb_secret_...), mint a service-role JWT
-    if service_key:
-        try:
-            now = int(time.time())
-            payload = {
-                "role": "service_role",
-                "iss": "supabase",
-                "iat": now,
-                "exp": now + 3600,  # 1 hour
-            }
-            token = pyjwt.encode(payload, service_key, algorithm="HS256")
-            logger.info("Minted service-role JWT from SUPABASE_SERVICE_KEY secret")
-            return url, token
-        except Exception as e:
-            logger.warning(f"Failed to mint service-role JWT: {e}")
+class UploadStream:
+    """Async iterator over an UploadFile, one chunk at a time, so the whole file never
+    sits in memory. Counts the bytes sent and aborts (FileTooLarge) once `limit` is crossed."""
 
-    # 3) Fallback to anon key
-    if not url or not anon_key:
-        logger.error(f"Missing Supabase config: URL={'set' if url else 'MISSING'}, KEY={'set' if anon_key else 'MISSING'}")
-        return None, None
-    logger.warning("Using anon key for storage — uploads may fail due to RLS policies")
-    return url, anon_key
+    def __init__(self, file: UploadFile, limit: int = MAX_FILE_SIZE, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.file = file
+        self.limit = limit
+        self.chunk_size = chunk_size
+        self.size = 0
 
+    async def __aiter__(self):
+        while True:
+            chunk = await self.file.read(self.chunk_size)
+            if not chunk:
+                break
+            self.size += len(chunk)
+            if self.size > self.limit:
+                raise FileTooLarge()
+            yield chunk
 
-@router.post("")
-async def upload_file(
-    file: UploadFile = File(...),
-    current_user: dict = Depends(get_current_user),
-):
-    """Upload a file to Supabase Storage via REST API (admin only). Returns the public URL."""
 
-    supabase_url, supabase_key = _get_supabase_config()
+def _storage_config():
+    supabase_url, supabase_key = storage.credentials()
     if not supabase_url or not supabase_key:
         raise HTTPException(
             status_code=503,
             detail="Supabase Storage not configured. SUPABASE_URL and SUPABASE_ANON_KEY must be set."
         )
+    return supabase_url, supabase_key
 
-    # Validate extension
-    _, ext = os.path.splitext(file.filename or "")
+
+def _check_file(filename: Optional[str], size: Optional[int]):
+    """Upload policy: allowed extension, and the size limit when the size is known"""
+    _, ext = os.path.splitext(filename or "")
     ext = ext.lower()
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail=f"File type '{ext}' not allowed. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
         )
+    if size is not None and size > MAX_FILE_SIZE:
+        raise _too_large()
 
-    # Read contents and check size
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB.",
-        )
 
-    # Generate unique filename (no spaces, safe for URLs)
-    safe_filename = (file.filename or "file").replace(" ", "_")
-    unique_name = f"{uuid.uuid4().hex[:12]}_{safe_filename}"
+def _validate_file(file: UploadFile):
+    # UploadStream enforces the size limit when it isn't known up front
+    _check_file(file.filename, file.size)
+
+
+def _content_name(sha256: str, filename: Optional[str]) -> str:
+    _, ext = os.path.splitext(filename or "")
+    return f"{sha256}{ext.lower()}"
+
+
+def _unique_name(filename: Optional[str]) -> str:
+    # Unique object name (no spaces, safe for URLs)
+    safe_filename = (filename or "file").replace(" ", "_")
+    return f"{uuid.uuid4().hex[:12]}_{safe_filename}"
+
+
+async def _hash_file(file: UploadFile):
+    """SHA-256 of the spooled upload, read in chunks (enforces MAX_FILE_SIZE on the way)"""
+    digest = hashlib.sha256()
+    stream = UploadStream(file)
+    try:
+        async for chunk in stream:
+            digest.update(chunk)
+    except FileTooLarge:
+        logger.warning(f"Rejected {file.filename}: over {MAX_FILE_SIZE} bytes")
+        raise _too_large()
+    await file.seek(0)
+    return digest.hexdigest(), stream.size
+
+
+async def _find_stored(sha256: str):
+    # Own session: batch uploads look files up concurrently
+    async with AsyncSessionLocal() as db:
+        return await db.get(StoredFile, sha256)
+
+
+def _stored_result(stored: StoredFile, original_filename: Optional[str]):
+    return {
+        "url": stored.url,
+        "filename": stored.filename,
+        "original_filename": original_filename,
+        "size": stored.size,
+        "content_type": stored.content_type,
+        "sha256": stored.sha256,
+        "deduplicated": True,
+    }
+
+
+async def _record_stored(**values):
+    async with AsyncSessionLocal() as db:
+        db.add(StoredFile(**values))
+        try:
+            await db.commit()
+        except IntegrityError:
+            # The same bytes were stored concurrently (e.g. twice in one batch)
+            await db.rollback()
+
+
+async def _store_file(file: UploadFile, supabase_url: str, supabase_key: str):
+    """Stream one validated file to the bucket, named by its SHA-256; returns its upload result.
+
+    Bytes already in the bucket aren't sent again: the existing object is returned.
+    """
+    sha256, size = await _hash_file(file)
     content_type = file.content_type or "application/octet-stream"
 
+    stored = await _find_stored(sha256)
+    if stored:
+        logger.info(f"{file.filename} is already stored as {stored.filename}, skipping the upload")
+        return _stored_result(stored, file.filename)
+
+    unique_name = _content_name(sha256, file.filename)
+
     # Upload via Supabase Storage REST API
-    upload_url = f"{supabase_url}/storage/v1/object/{STORAGE_BUCKET}/{unique_name}"
+    upload_url = storage.object_url(supabase_url, unique_name)
     headers = {
-        "Authorization": f"Bearer {supabase_key}",
-        "apikey": supabase_key,
+        **storage.auth_headers(supabase_key),
         "Content-Type": content_type,
-        "x-upsert": "true",           # overwrite if exists, avoids duplicate errors
+        "Content-Length": str(size),  # lets httpx send a plain body instead of chunked transfer encoding
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "x-upsert": "true",           # same name means same bytes, so overwriting is harmless
     }
 
-    logger.info(f"Uploading {unique_name} ({len(contents)} bytes) to {STORAGE_BUCKET}")
-    logger.info(f"Key type: {'service-role JWT' if supabase_key.startswith('eyJ') and len(supabase_key) > 100 else 'anon key'}")
-
+    logger.info(f"Uploading {unique_name} ({size} bytes) to {STORAGE_BUCKET}")
 
+    stream = UploadStream(file)
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(upload_url, content=contents, headers=headers)
+        with storage_errors("uploading to Supabase"):
+            resp = await storage.client.post(upload_url, content=stream, headers=headers)
 
         if resp.status_code not in (200, 201):
             detail = resp.text
@@ -125,18 +194,25 @@ async def upload_file(
             )
 
         # Build public URL
-        public_url = f"{supabase_url}/storage/v1/object/public/{STORAGE_BUCKET}/{unique_name}"
+        public_url = storage.public_url(supabase_url, unique_name)
+        await _record_stored(
+            sha256=sha256, filename=unique_name, url=public_url, size=stream.size,
+            content_type=content_type, original_filename=file.filename,
+        )
 
         return {
             "url": public_url,
             "filename": unique_name,
             "original_filename": file.filename,
-            "size": len(contents),
+            "size": stream.size,
+            "content_type": content_type,
+            "sha256": sha256,
+            "deduplicated": False,
         }
 
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error uploading to Supabase: {e}")
-        raise HTTPException(status_code=502, detail=f"Could not reach Supabase Storage: {str(e)}")
+    except FileTooLarge:
+        logger.warning(f"Aborted upload of {unique_name}: over {MAX_FILE_SIZE} bytes")
+        raise _too_large()
     except HTTPException:
         raise
     except Exception as e:
@@ -144,31 +220,405 @@ async def upload_file(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+async def _schedule_derivatives(background_tasks: BackgroundTasks, result: dict, supabase_url: str,
+                                supabase_key: str):
+    """Queue responsive variants for an uploaded image.
+
+    The result gets the manifest's URL and a `derivatives` status: "pending" until the
+    job writes the manifest (<name>.srcset.json, next to the image, 404 until then),
+    whose own "status" then says whether it's "ready" or "failed".
+    """
+    if not wants_derivatives(result["filename"]):
+        return result
+    manifest_url = storage.public_url(supabase_url, manifest_name(result["filename"]))
+    result["manifest_url"] = manifest_url
+    if result.get("deduplicated"):
+        # Made when the file was first stored, unless that job never finished
+        try:
+            ready = (await storage.client.head(manifest_url, timeout=10.0)).status_code == 200
+        except Exception as e:
+            logger.warning(f"Could not check the manifest of {result['filename']}: {e}")
+            ready = False
+        if ready:
+            result["derivatives"] = "ready"
+            return result
+    result["derivatives"] = "pending"
+    background_tasks.add_task(process_image, result["filename"], supabase_url, supabase_key)
+    return result
+
+
+@router.post("")
+async def upload_file(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_user: dict = Depends(get_current_user),
+):
+    """Upload a file to Supabase Storage via REST API (admin only). Returns the public URL."""
+    supabase_url, supabase_key = _storage_config()
+    logger.info(f"Key type: {'service-role JWT' if supabase_key.startswith('eyJ') and len(supabase_key) > 100 else 'anon key'}")
+    _validate_file(file)
+    result = await _store_file(file, supabase_url, supabase_key)
+    return await _schedule_derivatives(background_tasks, result, supabase_url, supabase_key)
+
+
+@router.post("/batch")
+async def upload_files(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(...),
+    current_user: dict = Depends(get_current_user),
+):
+    """Upload several files at once (admin only), e.g. a project's gallery.
+
+    Files go to storage concurrently, at most UPLOAD_CONCURRENCY at a time, so a
+    gallery takes about as long as its slowest file. One result per file, in the
+    order sent; a failed file doesn't fail the others.
+    """
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(status_code=400, detail=f"Too many files. Maximum is {MAX_BATCH_FILES} per batch.")
+    supabase_url, supabase_key = _storage_config()
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def upload_one(file: UploadFile):
+        try:
+            _validate_file(file)
+            async with semaphore:
+                result = await _store_file(file, supabase_url, supabase_key)
+            await _schedule_derivatives(background_tasks, result, supabase_url, supabase_key)
+            return {"ok": True, **result}
+        except HTTPException as e:
+            return {"ok": False, "original_filename": file.filename, "status_code": e.status_code, "error": e.detail}
+
+    results = await asyncio.gather(*(upload_one(file) for file in files))
+    uploaded = sum(1 for result in results if result["ok"])
+    return {"uploaded": uploaded, "failed": len(results) - uploaded, "results": results}
+
+
+async def _sign(supabase_url: str, supabase_key: str, name: str) -> str:
+    """Token that lets a client upload `name` straight to the bucket, for SIGNED_UPLOAD_EXPIRES_IN"""
+    with storage_errors("signing upload"):
+        resp = await storage.client.post(
+            storage.sign_upload_url(supabase_url, name),
+            headers={**storage.auth_headers(supabase_key), "x-upsert": "true"},
+            timeout=30.0,
+        )
+    if resp.status_code not in (200, 201):
+        logger.error(f"Supabase sign failed ({resp.status_code}): {resp.text}")
+        raise HTTPException(status_code=502, detail=f"Supabase Storage error ({resp.status_code}): {resp.text}")
+    # Relative to the storage API, e.g. /object/upload/sign/<bucket>/<name>?token=...
+    return parse_qs(urlparse(resp.json()["url"]).query)["token"][0]
+
+
+@router.post("/sign")
+async def sign_upload(
+    request: SignedUploadRequest,
+    current_user: dict = Depends(get_current_user),
+):
+    """Issue a signed URL for uploading one file straight to Supabase Storage (admin only).
+
+    The client PUTs the file to `upload_url` with the returned headers, then calls
+    /finalize. The file itself never goes through this function. With its `sha256`,
+    the file is named by it like in POST /upload, and bytes already in the bucket get
+    the existing object back (`"deduplicated": true`, no `upload_url`).
+    """
+    supabase_url, supabase_key = _storage_config()
+    _check_file(request.filename, request.size)
+
+    if request.sha256:
+        stored = await _find_stored(request.sha256)
+        if stored:
+            logger.info(f"{request.filename} is already stored as {stored.filename}, no upload needed")
+            return _stored_result(stored, request.filename)
+        unique_name = _content_name(request.sha256, request.filename)
+    else:
+        unique_name = _unique_name(request.filename)
+    token = await _sign(supabase_url, supabase_key, unique_name)
+    return {
+        "upload_url": f"{storage.sign_upload_url(supabase_url, unique_name)}?token={token}",
+        "method": "PUT",
+        "headers": {
+            "Content-Type": request.content_type or "application/octet-stream",
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,  # the name never gets other bytes
+            "x-upsert": "true",
+        },
+        "filename": unique_name,
+        "sha256": request.sha256,
+        "deduplicated": False,
+        "expires_in": SIGNED_UPLOAD_EXPIRES_IN,
+    }
+
+
+async def _hash_stored(name: str, supabase_url: str, supabase_key: str) -> str:
+    """SHA-256 of an object in the bucket, read in chunks"""
+    digest = hashlib.sha256()
+    with storage_errors("reading back upload"):
+        async with storage.client.stream(
+            "GET", storage.object_info_url(supabase_url, name), headers=storage.auth_headers(supabase_key),
+        ) as resp:
+            if resp.status_code != 200:
+                raise HTTPException(status_code=502, detail=f"Supabase Storage error ({resp.status_code})")
+            async for chunk in resp.aiter_bytes(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def _discard_upload(name: str, supabase_url: str, supabase_key: str):
+    with storage_errors("deleting a rejected upload"):
+        await storage.client.request(
+            "DELETE", storage.object_url(supabase_url), json={"prefixes": [name]},
+            headers=storage.auth_headers(supabase_key), timeout=30.0,
+        )
+
+
+@router.post("/finalize")
+async def finalize_upload(
+    request: FinalizeUploadRequest,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user),
+):
+    """Confirm a signed upload landed in the bucket (admin only). Returns the public URL.
+
+    A file named by its SHA-256 is read back and checked against it before it's
+    recorded, so later uploads of the same bytes reuse it.
+    """
+    supabase_url, supabase_key = _storage_config()
+    _check_file(request.filename, None)
+    with storage_errors("checking upload"):
+        resp = await storage.client.head(
+            storage.object_info_url(supabase_url, request.filename),
+            headers=storage.auth_headers(supabase_key),
+            timeout=30.0,
+        )
+    if resp.status_code in (400, 404):
+        raise HTTPException(status_code=404, detail=f"File {request.filename} has not been uploaded")
+    if resp.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Supabase Storage error ({resp.status_code})")
+
+    size = int(resp.headers.get("content-length", 0))
+    if size > MAX_FILE_SIZE:
+        # The signed URL can't enforce the declared size, so drop oversized objects here
+        await _discard_upload(request.filename, supabase_url, supabase_key)
+        raise _too_large()
+
+    result = {
+        "url": storage.public_url(supabase_url, request.filename),
+        "filename": request.filename,
+        "original_filename": request.original_filename,
+        "size": size,
+        "content_type": resp.headers.get("content-type"),
+        "sha256": None,
+        "deduplicated": False,
+    }
+    content_addressed = CONTENT_ADDRESSED_NAME.match(request.filename)
+    if content_addressed:
+        sha256 = content_addressed.group(1)
+        if await _hash_stored(request.filename, supabase_url, supabase_key) != sha256:
+            await _discard_upload(request.filename, supabase_url, supabase_key)
+            raise HTTPException(status_code=400, detail=f"File {request.filename} doesn't match its SHA-256")
+        await _record_stored(
+            sha256=sha256, filename=request.filename, url=result["url"], size=size,
+            content_type=result["content_type"], original_filename=request.original_filename,
+        )
+        result["sha256"] = sha256
+    return await _schedule_derivatives(background_tasks, result, supabase_url, supabase_key)
+
+
+# Resumable uploads: like /sign, the bytes go from the client straight to storage, here
+# in chunks to Supabase's TUS endpoint for signed uploads (a function can't take 6 MB
+# chunks: Vercel rejects request bodies over 4.5 MB). resumable_uploads keeps the
+# bookkeeping, so any instance can tell a client where to resume.
+
+def _tus_headers(upload: ResumableUpload):
+    return {"Tus-Resumable": TUS_VERSION, "x-signature": upload.upload_token}
+
+
+def _tus_metadata(**values):
+    return ",".join(f"{key} {base64.b64encode(value.encode()).decode()}" for key, value in values.items())
+
+
+def _offset_headers(response: Response, upload: ResumableUpload):
+    response.headers["Upload-Offset"] = str(upload.offset)
+    response.headers["Upload-Length"] = str(upload.size)
+
+
+def _upload_state(upload: ResumableUpload, supabase_url: str):
+    complete = upload.offset >= upload.size
+    state = {
+        "upload_id": upload.id,
+        "filename": upload.filename,
+        "offset": upload.offset,
+        "size": upload.size,
+        "chunk_size": RESUMABLE_CHUNK_SIZE,
+        "complete": complete,
+        "url": storage.public_url(supabase_url, upload.filename) if complete else None,
+    }
+    if not complete:
+        # Where the client PATCHes the remaining chunks, with these headers
+        state["upload_url"] = upload.upstream_url
+        state["headers"] = _tus_headers(upload)
+    return state
+
+
+async def _get_upload(db: AsyncSession, upload_id: str) -> ResumableUpload:
+    upload = await db.get(ResumableUpload, upload_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return upload
+
+
+async def _sync_offset(db: AsyncSession, upload: ResumableUpload) -> bool:
+    """Refresh the offset from storage, which receives the chunks; True once the upload just completed"""
+    resp = await storage.client.head(upload.upstream_url, headers=_tus_headers(upload), timeout=30.0)
+    if resp.status_code in (404, 410):
+        raise HTTPException(status_code=410, detail="Upload expired, start a new one")
+    if resp.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Supabase Storage error ({resp.status_code})")
+    offset = int(resp.headers["Upload-Offset"])
+    if offset == upload.offset:
+        return False
+    upload.offset = offset
+    completed = offset >= upload.size
+    if completed:
+        upload.completed_at = datetime.utcnow()
+        logger.info(f"Resumable upload {upload.id} complete: {upload.filename}")
+    await db.commit()
+    return completed
+
+
+@router.post("/resumable", status_code=201)
+async def create_resumable_upload(
+    request: SignedUploadRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Start a resumable upload (admin only).
+
+    The client PATCHes `chunk_size` chunks to `upload_url` with the returned headers
+    (the TUS protocol), then calls GET /resumable/{upload_id} to confirm it's complete.
+    """
+    supabase_url, supabase_key = _storage_config()
+    _check_file(request.filename, request.size)
+
+    unique_name = _unique_name(request.filename)
+    content_type = request.content_type or "application/octet-stream"
+    token = await _sign(supabase_url, supabase_key, unique_name)
+    with storage_errors("creating resumable upload"):
+        resp = await storage.client.post(
+            storage.signed_resumable_url(supabase_url),
+            headers={
+                "Tus-Resumable": TUS_VERSION,
+                "x-signature": token,
+                "Upload-Length": str(request.size),
+                "Upload-Metadata": _tus_metadata(
+                    bucketName=STORAGE_BUCKET, objectName=unique_name, contentType=content_type
+                ),
+                "x-upsert": "true",
+            },
+            timeout=30.0,
+        )
+    if resp.status_code != 201:
+        logger.error(f"Supabase resumable create failed ({resp.status_code}): {resp.text}")
+        raise HTTPException(status_code=502, detail=f"Supabase Storage error ({resp.status_code}): {resp.text}")
+
+    upload = ResumableUpload(
+        filename=unique_name,
+        original_filename=request.filename,
+        content_type=content_type,
+        size=request.size,
+        offset=0,
+        upstream_url=urljoin(storage.signed_resumable_url(supabase_url) + "/", resp.headers["Location"]),
+        upload_token=token,
+    )
+    db.add(upload)
+    await db.commit()
+    _offset_headers(response, upload)
+    return _upload_state(upload, supabase_url)
+
+
+@router.api_route("/resumable/{upload_id}", methods=["GET", "HEAD"])
+async def get_resumable_upload(
+    upload_id: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Current offset of a resumable upload (admin only): resume by sending the bytes from there.
+
+    Call it once the last chunk is sent: the response has the public URL, and images
+    get their responsive variants queued.
+    """
+    supabase_url, supabase_key = _storage_config()
+    upload = await _get_upload(db, upload_id)
+    completed = False
+    if upload.offset < upload.size:
+        with storage_errors("checking resumable upload"):
+            completed = await _sync_offset(db, upload)
+    _offset_headers(response, upload)
+    state = _upload_state(upload, supabase_url)
+    if completed:
+        await _schedule_derivatives(background_tasks, state, supabase_url, supabase_key)
+    return state
+
+
+# Columns that may hold an uploaded file's public URL
+FILE_URL_COLUMNS = (
+    Skill.icon_url, Project.image_url, Project.video_url, Project.video_poster_url,
+    WorkExperience.company_logo_url, Education.logo_url, Hobby.icon_url, Hobby.image_url,
+    Resume.file_url, Testimonial.author_image_url,
+)
+
+
+async def _count_references(db: AsyncSession, url: str) -> int:
+    """How many records point at `url`: content-addressed objects can back several of them"""
+    counts = [select(func.count()).select_from(column.table).where(column == url) for column in FILE_URL_COLUMNS]
+    counts.append(select(func.count()).select_from(Project).where(cast(Project.gallery_urls, String).contains(url)))
+    result = await db.execute(union_all(*counts))
+    return sum(result.scalars().all())
+
+
 @router.delete("/{filename}")
 async def delete_file(
     filename: str,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """Delete a file from Supabase Storage via REST API (admin only)."""
+    """Delete a file from Supabase Storage via REST API (admin only).
 
-    supabase_url, supabase_key = _get_supabase_config()
+    Refused (409) while a record still uses the file: identical uploads share one object,
+    so it only goes once its last reference has been removed.
+    """
+    supabase_url, supabase_key = storage.credentials()
     if not supabase_url or not supabase_key:
         raise HTTPException(status_code=503, detail="Supabase Storage not configured")
 
-    delete_url = f"{supabase_url}/storage/v1/object/{STORAGE_BUCKET}"
+    references = await _count_references(db, storage.public_url(supabase_url, filename))
+    if references:
+        raise HTTPException(
+            status_code=409,
+            detail=f"File {filename} is still used by {references} record(s): remove it from them first",
+        )
+
+    delete_url = storage.object_url(supabase_url)
+    # An image's variants and manifest go with it
+    prefixes = [filename] + (await stored_derivatives(filename, supabase_url) if wants_derivatives(filename) else [])
     headers = {
-        "Authorization": f"Bearer {supabase_key}",
-        "apikey": supabase_key,
+        **storage.auth_headers(supabase_key),
         "Content-Type": "application/json",
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.request("DELETE", delete_url, json={"prefixes": [filename]}, headers=headers)
+        with storage_errors("deleting from Supabase"):
+            resp = await storage.client.request(
+                "DELETE", delete_url, json={"prefixes": prefixes}, headers=headers, timeout=30.0
+            )
 
         if resp.status_code not in (200, 201, 204):
             raise HTTPException(status_code=502, detail=f"Supabase delete error: {resp.text}")
 
+        # Later uploads of the same bytes must store them again
+        await db.execute(delete(StoredFile).where(StoredFile.filename == filename))
+        await db.commit()
         return {"message": f"File {filename} deleted successfully"}
     except HTTPException:
         raise
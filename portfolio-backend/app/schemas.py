@@ -49,6 +49,8 @@ class ProjectCreate(ProjectBase):
 
 class ProjectResponse(ProjectBase):
     id: str
+    video_poster_url: Optional[str] = None
+    video_duration: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     
@@ -341,3 +343,142 @@ class TestimonialResponse(TestimonialBase):
     
     class Config:
         from_attributes = True
+
+# Portfolio Schemas
+class PortfolioResponse(BaseModel):
+    """Every public section of the portfolio in a single payload"""
+    skills: List[SkillResponse]
+    projects: List[ProjectResponse]
+    work_experience: List[WorkExperienceResponse]
+    education: List[EducationResponse]
+    hobbies: List[HobbyResponse]
+    testimonials: List[TestimonialResponse]
+    resumes: List[ResumeResponse]
+
+# Single-language Schemas (?lang=en|fr): each _en/_fr pair collapses into one field
+class SkillLocalizedResponse(BaseModel):
+    id: str
+    name: str
+    category: str
+    proficiency: int
+    icon_url: Optional[str] = None
+    display_order: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class ProjectLocalizedResponse(BaseModel):
+    id: str
+    title: str
+    description: str
+    short_description: Optional[str] = None
+    image_url: Optional[str] = None
+    video_url: Optional[str] = None
+    video_poster_url: Optional[str] = None
+    video_duration: Optional[float] = None
+    gallery_urls: Optional[List[str]] = None
+    project_url: Optional[str] = None
+    github_url: Optional[str] = None
+    technologies: Optional[List[str]] = None
+    category: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_featured: bool = False
+    display_order: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class WorkExperienceLocalizedResponse(BaseModel):
+    id: str
+    company_name: str
+    position: str
+    description: str
+    location: Optional[str] = None
+    employment_type: Optional[str] = None
+    start_date: date
+    end_date: Optional[date] = None
+    is_current: bool = False
+    company_logo_url: Optional[str] = None
+    company_website: Optional[str] = None
+    achievements: Optional[List[str]] = None
+    display_order: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class EducationLocalizedResponse(BaseModel):
+    id: str
+    institution_name: str
+    degree: str
+    field_of_study: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_date: date
+    end_date: Optional[date] = None
+    is_current: bool = False
+    grade: Optional[str] = None
+    logo_url: Optional[str] = None
+    achievements: Optional[List[str]] = None
+    display_order: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class HobbyLocalizedResponse(BaseModel):
+    id: str
+    name: str
+    description: str
+    icon_url: Optional[str] = None
+    image_url: Optional[str] = None
+    display_order: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class ResumeLocalizedResponse(BaseModel):
+    id: str
+    title: str
+    file_url: str
+    file_name: str
+    language: str
+    file_size: Optional[int] = None
+    is_active: bool = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class TestimonialLocalizedResponse(BaseModel):
+    id: str
+    author_name: str
+    author_email: str
+    author_position: Optional[str] = None
+    author_company: Optional[str] = None
+    author_image_url: Optional[str] = None
+    testimonial_text: str
+    rating: int = 5
+    status: str
+    display_order: int = 0
+    created_at: datetime
+    reviewed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class PortfolioLocalizedResponse(BaseModel):
+    """Every public section of the portfolio in a single language"""
+    skills: List[SkillLocalizedResponse]
+    projects: List[ProjectLocalizedResponse]
+    work_experience: List[WorkExperienceLocalizedResponse]
+    education: List[EducationLocalizedResponse]
+    hobbies: List[HobbyLocalizedResponse]
+    testimonials: List[TestimonialLocalizedResponse]
+    resumes: List[ResumeLocalizedResponse]
+
+# Upload Schemas
+class SignedUploadRequest(BaseModel):
+    filename: str
+    size: int = Field(ge=0, description="File size in bytes, checked against the upload limit")
+    content_type: Optional[str] = None
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-f]{64}$", description="Hex SHA-256 of the file, to store it once")
+
+class FinalizeUploadRequest(BaseModel):
+    filename: str
+    original_filename: Optional[str] = None
@@ -0,0 +1,184 @@
+import os
+import glob
+import json
+import hashlib
+import logging
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from app.cache import table_versions
+from app.database import AsyncSessionLocal
+from app.localization import LANGUAGES
+from app.portfolio_snapshot import PUBLIC_SECTIONS, SNAPSHOT_LANGS, load_snapshot
+from app.storage import storage, IMMUTABLE_CACHE_CONTROL
+
+logger = logging.getLogger("snapshot")
+
+MANIFEST_NAME = "manifest.json"
+SNAPSHOT_PREFIX = "snapshot"  # folder in the storage bucket
+SNAPSHOT_ON_WRITE = os.getenv("SNAPSHOT_ON_WRITE", "").lower() in ("1", "true", "yes")
+
+
+def snapshot_endpoints():
+    """(name, render, tables) for every public GET worth a static copy.
+
+    Names follow the route (`projects.featured.fr` is /api/projects/featured?lang=fr);
+    `render(db)` returns the response body. Routers are imported here as they import
+    app.cache, which imports this module lazily.
+    """
+    from app.routers import skills, projects, work_experience, education, hobbies, testimonials, resumes
+
+    routes = []
+    for lang in (None, *LANGUAGES):
+        suffix = f".{lang}" if lang else ""
+        routes += [
+            (f"skills{suffix}", skills.get_skills, {"lang": lang}),
+            (f"projects{suffix}", projects.get_projects, {"lang": lang}),
+            (f"projects.featured{suffix}", projects.get_featured_projects, {"lang": lang}),
+            (f"work_experience{suffix}", work_experience.get_work_experience, {"lang": lang}),
+            (f"education{suffix}", education.get_education, {"lang": lang}),
+            (f"hobbies{suffix}", hobbies.get_hobbies, {"lang": lang}),
+            (f"testimonials{suffix}", testimonials.get_testimonials, {"lang": lang}),
+            (f"resumes{suffix}", resumes.get_resumes, {"lang": lang}),
+        ]
+    routes += [
+        (f"resumes.active.{language}", resumes.get_active_resume, {"language": language})
+        for language in LANGUAGES
+    ]
+    endpoints = [
+        (f"portfolio.{lang}" if lang else "portfolio", _stored_portfolio(lang), tuple(PUBLIC_SECTIONS))
+        for lang in SNAPSHOT_LANGS
+    ]
+    endpoints += [(name, _handler_render(handler, params), handler.cached_tables) for name, handler, params in routes]
+    return endpoints
+
+
+def _handler_render(handler, params):
+    # The undecorated handler: same query and serialization as the API, without the HTTP cache layer
+    async def render(db) -> bytes:
+        call = handler.__wrapped__
+        return (await call(**params, db=db)).body
+    return render
+
+
+def _stored_portfolio(lang):
+    # /api/portfolio serves the portfolio_snapshot row as is
+    async def render(db) -> bytes:
+        return (await load_snapshot(db, lang))[1]
+    return render
+
+
+class DirectoryTarget:
+    """Snapshot files in a local folder (e.g. the frontend's public/snapshot, deployed with it)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    async def read(self, name: str):
+        try:
+            with open(os.path.join(self.path, name), "rb") as source:
+                return source.read()
+        except FileNotFoundError:
+            return None
+
+    async def write(self, name: str, body: bytes, immutable: bool):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, name), "wb") as out:
+            out.write(body)
+
+    async def prune(self, keep):
+        # The folder ships as a whole, so superseded versions can go
+        for path in glob.glob(os.path.join(self.path, "*.json")):
+            if os.path.basename(path) not in keep:
+                os.remove(path)
+
+    def url(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+
+class StorageTarget:
+    """Snapshot files in the storage bucket, under snapshot/ (what the write hook uses)"""
+
+    def __init__(self):
+        self.supabase_url, self.supabase_key = storage.credentials()
+        if not self.supabase_url or not self.supabase_key:
+            raise RuntimeError("Storage not configured (SUPABASE_URL / SUPABASE_SERVICE_KEY)")
+
+    async def read(self, name: str):
+        resp = await storage.client.get(self.url(name), headers={"Cache-Control": "no-cache"})
+        return resp.content if resp.status_code == 200 else None
+
+    async def write(self, name: str, body: bytes, immutable: bool):
+        resp = await storage.client.post(
+            storage.object_url(self.supabase_url, f"{SNAPSHOT_PREFIX}/{name}"), content=body,
+            headers={
+                **storage.auth_headers(self.supabase_key),
+                "Content-Type": "application/json",
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else "no-cache",
+                "x-upsert": "true",
+            },
+        )
+        resp.raise_for_status()
+
+    async def prune(self, keep):
+        # Clients holding the previous manifest may still fetch its files: leave them
+        pass
+
+    def url(self, name: str) -> str:
+        return storage.public_url(self.supabase_url, f"{SNAPSHOT_PREFIX}/{name}")
+
+
+async def export_snapshot(target, force: bool = False):
+    """Render the public endpoints into `<name>.<content hash>.json` files plus a manifest.
+
+    Incremental: only endpoints reading a table whose version (see app.cache.table_versions)
+    changed since the previous manifest are rendered again, and a file is only written when
+    its content hash is new. Versions and bodies are read in one primary session (a single
+    snapshot of the database on Postgres), so the manifest never pairs a body with the
+    version of another state. Returns the manifest and the names that were re-rendered.
+    """
+    previous = json.loads(await target.read(MANIFEST_NAME) or b"{}")
+    endpoints = snapshot_endpoints()
+    tables = sorted({table for _, _, endpoint_tables in endpoints for table in endpoint_tables})
+
+    files = dict(previous.get("files", {}))
+    rendered = []
+    async with AsyncSessionLocal() as db:
+        if db.bind.dialect.name == "postgresql":
+            await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        versions = await table_versions(*tables, db=db)
+        changed = {table for table in tables if force or previous.get("versions", {}).get(table) != versions[table]}
+        for name, render, endpoint_tables in endpoints:
+            if name in files and not changed.intersection(endpoint_tables):
+                continue
+            try:
+                body = await render(db)
+            except HTTPException:
+                # e.g. no active resume in that language: the API 404s, so no file either
+                files.pop(name, None)
+                continue
+            filename = f"{name}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+            if files.get(name) != filename:
+                await target.write(filename, body, immutable=True)
+            files[name] = filename
+            rendered.append(name)
+
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "versions": versions,
+        "files": files,
+    }
+    if rendered or previous.get("versions") != versions:
+        await target.write(MANIFEST_NAME, json.dumps(manifest, indent=2).encode(), immutable=False)
+    await target.prune(set(files.values()) | {MANIFEST_NAME})
+    return manifest, rendered
+
+
+async def refresh_snapshot():
+    """Write hook: bring the stored snapshot up to date after an admin change (opt-in)"""
+    if not SNAPSHOT_ON_WRITE:
+        return
+    try:
+        _, rendered = await export_snapshot(StorageTarget())
+        logger.info(f"Snapshot refreshed: {', '.join(rendered) or 'nothing changed'}")
+    except Exception as e:
+        logger.error(f"Snapshot refresh failed: {e}")
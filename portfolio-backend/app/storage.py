@@ -0,0 +1,147 @@
+import os
+import time
+import logging
+from contextlib import contextmanager
+import jwt as pyjwt
+from fastapi import HTTPException
+
+logger = logging.getLogger("storage")
+
+# Supabase Storage bucket name
+STORAGE_BUCKET = "portfolio-files"
+
+# For objects whose name changes whenever their content does (content hash, unique name)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+SERVICE_TOKEN_LIFETIME = 3600  # seconds, for tokens minted from a JWT secret
+SERVICE_TOKEN_REFRESH_MARGIN = 300  # re-mint this long before the token expires
+
+
+class StorageClient:
+    """Shared Supabase Storage client: one keep-alive (HTTP/2 when available) connection
+    pool and the service credentials, reused by every upload/delete.
+
+    The pool is opened on first use, to keep httpx off the cold-start path, and
+    closed by main.lifespan on shutdown.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._config = None
+        self._token = None
+        self._token_expires_at = 0
+
+    @property
+    def client(self):
+        if self._client is None:
+            import httpx
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+            )
+        return self._client
+
+    def _read_config(self):
+        if self._config is None:
+            self._config = (
+                os.getenv("SUPABASE_URL", "").rstrip("/"),
+                os.getenv("SUPABASE_SERVICE_KEY", ""),
+                os.getenv("SUPABASE_ANON_KEY", ""),
+            )
+        return self._config
+
+    def credentials(self):
+        """
+        Get Supabase URL and a key that bypasses RLS for storage operations.
+
+        The SUPABASE_SERVICE_KEY may be in one of two formats:
+        1. A real service-role JWT (starts with 'eyJ') → use directly.
+        2. The JWT secret (e.g. 'sb_secret_...') → mint a short-lived service-role JWT,
+           cached until shortly before it expires.
+        Falls back to anon key (may hit RLS).
+        """
+        url, service_key, anon_key = self._read_config()
+
+        # 1) If service key is already a JWT, use it directly
+        if service_key.startswith("eyJ"):
+            return url, service_key
+
+        # 2) If it looks like a JWT secret (sb_secret_...), mint a service-role JWT
+        if service_key:
+            now = int(time.time())
+            if self._token and now < self._token_expires_at - SERVICE_TOKEN_REFRESH_MARGIN:
+                return url, self._token
+            try:
+                payload = {
+                    "role": "service_role",
+                    "iss": "supabase",
+                    "iat": now,
+                    "exp": now + SERVICE_TOKEN_LIFETIME,
+                }
+                self._token = pyjwt.encode(payload, service_key, algorithm="HS256")
+                self._token_expires_at = payload["exp"]
+                logger.info("Minted service-role JWT from SUPABASE_SERVICE_KEY secret")
+                return url, self._token
+            except Exception as e:
+                logger.warning(f"Failed to mint service-role JWT: {e}")
+
+        # 3) Fallback to anon key
+        if not url or not anon_key:
+            logger.error(f"Missing Supabase config: URL={'set' if url else 'MISSING'}, KEY={'set' if anon_key else 'MISSING'}")
+            return None, None
+        logger.warning("Using anon key for storage — uploads may fail due to RLS policies")
+        return url, anon_key
+
+    def auth_headers(self, key: str):
+        return {"Authorization": f"Bearer {key}", "apikey": key}
+
+    @staticmethod
+    def object_url(base_url: str, path: str = "") -> str:
+        return f"{base_url}/storage/v1/object/{STORAGE_BUCKET}" + (f"/{path}" if path else "")
+
+    @staticmethod
+    def sign_upload_url(base_url: str, path: str) -> str:
+        return f"{base_url}/storage/v1/object/upload/sign/{STORAGE_BUCKET}/{path}"
+
+    @staticmethod
+    def object_info_url(base_url: str, path: str) -> str:
+        return f"{base_url}/storage/v1/object/authenticated/{STORAGE_BUCKET}/{path}"
+
+    @staticmethod
+    def signed_resumable_url(base_url: str) -> str:
+        """TUS endpoint taking an upload token (x-signature header) instead of a key"""
+        return f"{base_url}/storage/v1/upload/resumable/sign"
+
+    @staticmethod
+    def public_url(base_url: str, path: str) -> str:
+        return f"{base_url}/storage/v1/object/public/{STORAGE_BUCKET}/{path}"
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+@contextmanager
+def storage_errors(action: str):
+    """Turn transport errors (timeouts, refused connections...) of the calls made inside
+    into a 502, so callers only deal with storage's responses.
+
+    `action` completes the log line, e.g. "uploading to Supabase".
+    """
+    import httpx  # already loaded by then: the calls inside go through storage.client
+
+    try:
+        yield
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error {action}: {e}")
+        raise HTTPException(status_code=502, detail=f"Could not reach Supabase Storage: {str(e)}")
+
+
+storage = StorageClient()
@@ -0,0 +1,159 @@
+import os
+import json
+import shutil
+import asyncio
+import logging
+import tempfile
+from app.cache import invalidate
+from app.database import AsyncSessionLocal
+from app.models import Project
+from app.storage import storage
+
+logger = logging.getLogger("videos")
+
+FFMPEG = os.getenv("FFMPEG_PATH", "ffmpeg")
+FFPROBE = os.getenv("FFPROBE_PATH", "ffprobe")
+VIDEO_WORKERS = int(os.getenv("VIDEO_WORKERS", "1"))  # concurrent ffmpeg jobs per instance
+WEB_SUFFIX = "_web"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Codecs every browser plays inside an MP4: these only need remuxing, the rest is transcoded
+WEB_VIDEO_CODECS = {"h264"}
+WEB_AUDIO_CODECS = {"aac", "mp3"}
+
+_slots = None
+
+
+def _video_slots():
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(VIDEO_WORKERS)
+    return _slots
+
+
+def ffmpeg_available() -> bool:
+    return bool(shutil.which(FFMPEG) and shutil.which(FFPROBE))
+
+
+def needs_processing(video_url: str, supabase_url: str) -> bool:
+    """Videos in our bucket that haven't been through the pipeline yet"""
+    if not video_url or not supabase_url:
+        return False
+    prefix = storage.public_url(supabase_url, "")
+    name = video_url[len(prefix):] if video_url.startswith(prefix) else None
+    return bool(name) and not os.path.splitext(name)[0].endswith(WEB_SUFFIX)
+
+
+async def _run(*args):
+    process = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"{os.path.basename(args[0])} failed: {stderr.decode(errors='replace')[-500:]}")
+    return stdout
+
+
+async def probe(path: str):
+    """Duration (seconds) and the first video/audio codec names, from ffprobe"""
+    output = await _run(FFPROBE, "-v", "error", "-print_format", "json", "-show_format", "-show_streams", path)
+    info = json.loads(output)
+    codecs = {}
+    for stream in info.get("streams", []):
+        codecs.setdefault(stream.get("codec_type"), stream.get("codec_name"))
+    return float(info["format"].get("duration") or 0), codecs.get("video"), codecs.get("audio")
+
+
+async def make_web_video(source: str, target: str, video_codec: str, audio_codec: str):
+    """Fast-start MP4 (moov atom first): a plain remux when the codecs are already web-safe"""
+    if video_codec in WEB_VIDEO_CODECS and audio_codec in WEB_AUDIO_CODECS | {None}:
+        codec_args = ["-c", "copy"]
+    else:
+        codec_args = [
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "23", "-pix_fmt", "yuv420p",
+            "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",  # yuv420p needs even dimensions
+            "-c:a", "aac", "-b:a", "128k",
+        ]
+    await _run(FFMPEG, "-y", "-v", "error", "-i", source, "-map", "0:v:0", "-map", "0:a:0?",
+               *codec_args, "-movflags", "+faststart", target)
+
+
+async def make_poster(source: str, target: str, duration: float):
+    # A second in skips fade-ins; short clips use their middle frame
+    at = min(1.0, duration / 2) if duration else 0
+    await _run(FFMPEG, "-y", "-v", "error", "-ss", f"{at:.2f}", "-i", source, "-frames:v", "1", "-q:v", "3", target)
+
+
+async def _download(url: str, path: str):
+    async with storage.client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        with open(path, "wb") as out:
+            async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                out.write(chunk)
+
+
+async def _file_chunks(path: str):
+    with open(path, "rb") as source:
+        while chunk := source.read(DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+async def _upload(path: str, name: str, content_type: str, supabase_url: str, supabase_key: str):
+    resp = await storage.client.post(
+        storage.object_url(supabase_url, name),
+        content=_file_chunks(path),
+        headers={
+            **storage.auth_headers(supabase_key),
+            "Content-Type": content_type,
+            "Content-Length": str(os.path.getsize(path)),
+            "x-upsert": "true",
+        },
+    )
+    resp.raise_for_status()
+    return storage.public_url(supabase_url, name)
+
+
+async def process_project_video(project_id: str, video_url: str):
+    """Background job: make a project's uploaded video web-ready.
+
+    Stores <name>_web.mp4 (fast-start) and <name>_poster.jpg next to the original,
+    then points the project at them and records the duration - unless the project's
+    video changed in the meantime.
+    """
+    if not ffmpeg_available():
+        logger.warning(f"ffmpeg/ffprobe not found, leaving the video of project {project_id} as uploaded")
+        return
+    supabase_url, supabase_key = storage.credentials()
+    stem = os.path.splitext(video_url.rsplit("/", 1)[1])[0]
+
+    try:
+        async with _video_slots():
+            with tempfile.TemporaryDirectory(prefix="video-") as workdir:
+                source = os.path.join(workdir, "source")
+                web_video = os.path.join(workdir, "web.mp4")
+                poster = os.path.join(workdir, "poster.jpg")
+
+                await _download(video_url, source)
+                duration, video_codec, audio_codec = await probe(source)
+                await make_web_video(source, web_video, video_codec, audio_codec)
+                await make_poster(web_video, poster, duration)
+
+                web_url, poster_url = await asyncio.gather(
+                    _upload(web_video, f"{stem}{WEB_SUFFIX}.mp4", "video/mp4", supabase_url, supabase_key),
+                    _upload(poster, f"{stem}_poster.jpg", "image/jpeg", supabase_url, supabase_key),
+                )
+    except Exception as e:
+        logger.error(f"Video processing failed for project {project_id}: {e}")
+        return
+
+    async with AsyncSessionLocal() as db:
+        project = await db.get(Project, project_id)
+        if not project or project.video_url != video_url:
+            logger.info(f"Project {project_id} changed its video meanwhile, not updating it")
+            return
+        project.video_url = web_url
+        project.video_poster_url = poster_url
+        project.video_duration = round(duration, 2)
+        await db.commit()
+    await invalidate("projects")
+    logger.info(f"Video of project {project_id} is web-ready ({duration:.1f}s, {video_codec}/{audio_codec})")
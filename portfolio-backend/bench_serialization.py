@@ -0,0 +1,122 @@
+"""
+Microbenchmark of the public list read path on large synthetic lists.
+Compares, per list size, the old path (ORM entities -> FastAPI response_model
+validation -> jsonable_encoder -> stdlib json) with the fast path (Core rows ->
+bulk TypeAdapter validation -> orjson), query included, on a throwaway SQLite database.
+
+Usage:
+    python bench_serialization.py                    # 100, 1000 and 10000 projects
+    python bench_serialization.py --sizes 5000 --repeat 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Union
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import delete, insert, select
+from app.database import AsyncSessionLocal, Base, async_engine
+from app.localization import localized_rows, localized_select
+from app.models import Project
+from app.schemas import ProjectLocalizedResponse, ProjectResponse
+from app.serialization import ResponseAdapter
+
+# What get_projects declares as its response_model
+RESPONSE_FIELD = create_response_field(
+    name="bench", type_=Union[List[ProjectResponse], List[ProjectLocalizedResponse]]
+)
+PROJECT_LIST = ResponseAdapter(List[ProjectResponse], List[ProjectLocalizedResponse])
+
+
+def synthetic_projects(count):
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+    return [
+        {
+            "id": f"project-{i}",
+            "title_en": f"Project {i}", "title_fr": f"Projet {i}",
+            "description_en": text, "description_fr": text,
+            "short_description_en": text[:120], "short_description_fr": text[:120],
+            "image_url": f"https://example.com/{i}.jpg",
+            "gallery_urls": [f"https://example.com/{i}-{n}.jpg" for n in range(4)],
+            "technologies": ["Python", "FastAPI", "PostgreSQL", "React"],
+            "category": "web", "start_date": date(2024, 1, 1),
+            "is_featured": i % 5 == 0, "display_order": i, "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+async def old_path():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Project).filter(Project.is_active == True).order_by(Project.display_order))
+        projects = result.scalars().all()
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=projects, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast_path():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            localized_select(Project).filter(Project.is_active == True).order_by(Project.display_order)
+        )
+        rows = localized_rows(result)
+    return PROJECT_LIST.response(rows).body
+
+
+async def check_timezone_aware():
+    """Postgres returns timestamptz columns as aware datetimes, which SQLite doesn't: check
+    both encoders write them the same way (UTC as `Z`, other offsets as `+hh:mm`)"""
+    utc = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    paris = datetime(2024, 1, 1, 12, 30, 0, 250000, tzinfo=timezone(timedelta(hours=2)))
+    rows = [dict(row, created_at=utc, updated_at=paris) for row in synthetic_projects(2)]
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=rows, is_coroutine=True)
+    assert json.loads(JSONResponse(content).body) == json.loads(PROJECT_LIST.response(rows).body), \
+        "fast path changed how timezone-aware timestamps are written"
+
+
+async def timed(path, repeat):
+    await path()  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = await path()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), body
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    await check_timezone_aware()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'rows':>8} {'old (ms)':>10} {'fast (ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        async with async_engine.begin() as conn:
+            await conn.execute(delete(Project))
+            await conn.execute(insert(Project), synthetic_projects(size))
+        old_ms, old_body = await timed(old_path, args.repeat)
+        fast_ms, fast_body = await timed(fast_path, args.repeat)
+        # Different encoders, same document
+        assert json.loads(old_body) == json.loads(fast_body), "fast path changed the response"
+        print(f"{size:>8} {old_ms:>10.1f} {fast_ms:>10.1f} {old_ms / fast_ms:>7.1f}x")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
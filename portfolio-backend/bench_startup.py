@@ -0,0 +1,106 @@
+"""
+Cold-start benchmark for the serverless entry point.
+Each run starts a fresh interpreter, imports the app (what api/index.py does on a
+Vercel cold start), runs the lifespan hook and serves a first GET /api/health.
+Exits with status 1 when the median cold start is over budget, so it can gate CI.
+
+Usage:
+    python bench_startup.py                   # 5 runs, 1500 ms budget
+    python bench_startup.py --runs 10 --budget-ms 1000
+    STARTUP_BUDGET_MS=1200 python bench_startup.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+# Runs inside the fresh interpreter; prints one JSON line of timings
+CHILD = r"""
+import asyncio, json, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+
+async def first_request():
+    status = {}
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/health", "raw_path": b"/api/health", "root_path": "", "query_string": b"",
+        "headers": [], "server": ("bench", 80), "client": ("bench", 1),
+    }
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+    async with main.app.router.lifespan_context(main.app):
+        await main.app(scope, receive, send)
+    return status.get("code")
+
+code = asyncio.run(first_request())
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_request_ms": (t2 - t1) * 1000, "status": code}))
+"""
+
+
+def run_once():
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise SystemExit("❌ App failed to start")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    if timings["status"] != 200:
+        raise SystemExit(f"❌ First request returned {timings['status']}")
+    return timings
+
+
+def slowest_imports(limit=10):
+    """Top modules by cumulative import time (python -X importtime)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    first_request_ms = statistics.median(run["first_request_ms"] for run in runs)
+    total_ms = statistics.median(run["import_ms"] + run["first_request_ms"] for run in runs)
+
+    print(f"🧊 Cold start over {args.runs} runs (median)")
+    print(f"   import main:      {import_ms:8.1f} ms")
+    print(f"   first request:    {first_request_ms:8.1f} ms")
+    print(f"   total:            {total_ms:8.1f} ms   (budget {args.budget_ms:.0f} ms)")
+    print("\n🐢 Slowest imports (cumulative):")
+    for cumulative_us, name in slowest_imports():
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"\n❌ Cold start is {total_ms - args.budget_ms:.0f} ms over budget")
+        sys.exit(1)
+    print("\n✅ Cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Build the read-only SQLite replica of the public tables from the primary database.
+Run it before deploying and ship the file with the function: with SQLITE_REPLICA_PATH set,
+the public GET routes read from it (and keep working from it if the primary is down),
+while admin routes and writes go to the primary.
+
+Usage:
+    python build_replica.py                  # writes replica.db (or $SQLITE_REPLICA_PATH)
+    python build_replica.py --out /tmp/replica.db
+"""
+
+import argparse
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from app.database import engine
+from app.replica import dump_tables, write_replica
+
+DEFAULT_OUT = os.getenv("SQLITE_REPLICA_PATH") or "replica.db"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=DEFAULT_OUT, help="SQLite file to write")
+    args = parser.parse_args()
+    out = os.path.join(os.path.dirname(os.path.abspath(__file__)), args.out)
+
+    print("📦 Reading the public tables from the primary database...")
+    with engine.connect() as conn:
+        dump = dump_tables(conn)
+    write_replica(out, dump)
+    for name, rows in dump.items():
+        print(f"   {name}: {len(rows)} rows")
+    print(f"✅ Replica written to {out} ({os.path.getsize(out) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Render the public API responses into static, content-hashed JSON files.
+Each public endpoint (and its ?lang=en/fr variants) becomes <name>.<hash>.json in exactly
+the shape the API returns, listed in manifest.json, so the frontend can load e.g.
+/snapshot/portfolio.<hash>.json without calling the backend. Re-running only renders the
+endpoints whose tables changed since the last manifest.
+
+Usage:
+    python export_snapshot.py                       # into ../public/snapshot
+    python export_snapshot.py --out dist/snapshot --force
+    python export_snapshot.py --storage             # into the storage bucket, under snapshot/
+"""
+
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from app.database import async_engine
+from app.snapshot import DirectoryTarget, StorageTarget, MANIFEST_NAME, export_snapshot
+from app.storage import storage
+
+DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "snapshot")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=DEFAULT_OUT, help="folder to write the snapshot to")
+    parser.add_argument("--storage", action="store_true", help="upload to the storage bucket instead")
+    parser.add_argument("--force", action="store_true", help="re-render every endpoint")
+    args = parser.parse_args()
+
+    target = StorageTarget() if args.storage else DirectoryTarget(os.path.normpath(args.out))
+    try:
+        manifest, rendered = await export_snapshot(target, force=args.force)
+    finally:
+        await storage.aclose()
+        await async_engine.dispose()
+
+    for name in rendered:
+        print(f"📄 {manifest['files'][name]}")
+    skipped = len(manifest["files"]) - len(rendered)
+    print(f"✅ Rendered {len(rendered)} endpoint(s), {skipped} unchanged -> {target.url(MANIFEST_NAME)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,157 @@
+"""
+Local stand-in for the CDN in front of the API, for checking cache policies and purges.
+A caching reverse proxy that honours s-maxage, stale-while-revalidate, private/no-store
+and Vary, reports X-Cache: MISS/HIT/STALE, and drops tagged entries on POST /__purge.
+
+Usage:
+    python fake_edge.py                                   # http://localhost:54322 -> http://localhost:8080
+    python fake_edge.py --backend http://localhost:8000
+
+Then run the API with EDGE_PURGE_URL=http://localhost:54322/__purge and browse through the proxy;
+GET /__cache lists what is cached.
+"""
+
+import argparse
+import asyncio
+import time
+import httpx
+from fastapi import FastAPI, Request, Response
+
+app = FastAPI(title="Fake Edge Cache")
+
+BACKEND_URL = "http://localhost:8080"
+TAG_HEADER = "cache-tag"
+entries = {}      # (path?query, vary values) -> {"status", "headers", "body", "stored_at", "max_age", "swr", "tags"}
+variants = {}     # path?query -> Vary header names of its cached response
+revalidating = set()
+# Hop-by-hop headers and ones recomputed for the client
+SKIPPED_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-length", "host"}
+_client = None
+
+
+def _backend():
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(base_url=BACKEND_URL, timeout=60.0)
+    return _client
+
+
+def _directives(cache_control: str):
+    directives = {}
+    for part in (cache_control or "").lower().split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name] = value
+    return directives
+
+
+def _cache_key(request: Request, vary):
+    url = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+    return url, tuple(request.headers.get(name, "") for name in vary)
+
+
+async def _fetch(request: Request):
+    """Forward a request; the body is kept as sent (still gzip/br encoded), like a CDN does"""
+    headers = {name: value for name, value in request.headers.items() if name not in SKIPPED_HEADERS}
+    outgoing = _backend().build_request(request.method, request.url.path, params=request.query_params,
+                                        headers=headers, content=await request.body())
+    resp = await _backend().send(outgoing, stream=True)
+    try:
+        body = b"".join([chunk async for chunk in resp.aiter_raw()])
+    finally:
+        await resp.aclose()
+    return resp, body
+
+
+def _store(request: Request, resp: httpx.Response, body: bytes):
+    directives = _directives(resp.headers.get("cache-control"))
+    if request.method != "GET" or resp.status_code != 200 or "authorization" in request.headers:
+        return False
+    if "private" in directives or "no-store" in directives or "s-maxage" not in directives:
+        return False
+    vary = tuple(sorted(name.strip().lower() for name in resp.headers.get("vary", "").split(",") if name.strip()))
+    url = _cache_key(request, ())[0]
+    variants[url] = vary
+    entries[_cache_key(request, vary)] = {
+        "status": resp.status_code,
+        "headers": [(k, v) for k, v in resp.headers.multi_items() if k.lower() not in SKIPPED_HEADERS],
+        "body": body,
+        "stored_at": time.monotonic(),
+        "max_age": int(directives["s-maxage"] or 0),
+        "swr": int(directives.get("stale-while-revalidate") or 0),
+        "tags": {tag.strip() for tag in resp.headers.get(TAG_HEADER, "").split(",") if tag.strip()},
+    }
+    return True
+
+
+def _reply(status, headers, body, cache_status, age=0):
+    response = Response(body, status_code=status)
+    for name, value in headers:
+        response.headers.append(name, value)
+    response.headers["X-Cache"] = cache_status
+    response.headers["Age"] = str(int(age))
+    return response
+
+
+async def _revalidate(request: Request, key):
+    try:
+        _store(request, *await _fetch(request))
+    finally:
+        revalidating.discard(key)
+
+
+@app.post("/__purge")
+async def purge(request: Request):
+    tags = set((await request.json()).get("tags", []))
+    stale = [key for key, entry in entries.items() if entry["tags"] & tags]
+    for key in stale:
+        del entries[key]
+    print(f"🧹 Purged {len(stale)} entries tagged {sorted(tags)}")
+    return {"purged": len(stale)}
+
+
+@app.get("/__cache")
+async def list_cache():
+    now = time.monotonic()
+    return [
+        {"url": url, "vary": vary, "age": round(now - entry["stored_at"], 1), "tags": sorted(entry["tags"])}
+        for (url, vary), entry in entries.items()
+    ]
+
+
+@app.api_route("/{path:path}", methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
+async def proxy(path: str, request: Request):
+    # Like CDNs, never answer signed-in requests from the cache
+    if request.method == "GET" and "authorization" not in request.headers:
+        vary = variants.get(_cache_key(request, ())[0], ())
+        key = _cache_key(request, vary)
+        entry = entries.get(key)
+        if entry:
+            age = time.monotonic() - entry["stored_at"]
+            if age < entry["max_age"]:
+                return _reply(entry["status"], entry["headers"], entry["body"], "HIT", age)
+            if age < entry["max_age"] + entry["swr"]:
+                # Serve the stale copy now, refresh it in the background
+                if key not in revalidating:
+                    revalidating.add(key)
+                    asyncio.create_task(_revalidate(request, key))
+                return _reply(entry["status"], entry["headers"], entry["body"], "STALE", age)
+            del entries[key]
+
+    resp, body = await _fetch(request)
+    stored = _store(request, resp, body)
+    headers = [(k, v) for k, v in resp.headers.multi_items() if k.lower() not in SKIPPED_HEADERS]
+    return _reply(resp.status_code, headers, body, "MISS" if stored else "BYPASS")
+
+
+if __name__ == "__main__":
+    import uvicorn
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=54322)
+    parser.add_argument("--backend", default=BACKEND_URL, help="API to put the cache in front of")
+    parser.add_argument("--tag-header", default=TAG_HEADER, help="response header carrying cache tags (EDGE_TAG_HEADER)")
+    args = parser.parse_args()
+    BACKEND_URL = args.backend.rstrip("/")
+    TAG_HEADER = args.tag_header.lower()
+    print(f"🌐 Fake edge cache on http://localhost:{args.port} -> {BACKEND_URL}")
+    uvicorn.run(app, host="0.0.0.0", port=args.port)
@@ -0,0 +1,138 @@
+"""
+In-memory stand-in for the Supabase Storage API, for exercising uploads locally.
+Implements the endpoints the upload router uses: object upload/delete/HEAD,
+public GET, signed uploads and the TUS resumable endpoints (keyed and signed).
+
+Usage:
+    python fake_storage.py                  # serves on http://localhost:54321
+    python fake_storage.py --flaky 0.3      # 30% of chunk PATCHes keep half the chunk, then fail
+
+Then run the API with SUPABASE_URL=http://localhost:54321 (any SUPABASE_SERVICE_KEY).
+"""
+
+import argparse
+import base64
+import random
+import uuid
+from fastapi import FastAPI, Request, Response
+
+app = FastAPI(title="Fake Supabase Storage")
+
+objects = {}      # "bucket/name" -> (content_type, bytes)
+signed = {}       # token -> "bucket/name"
+resumable = {}    # id -> {"key", "length", "content_type", "data"}
+FLAKY_RATE = 0.0
+SIGNED_TUS_PATH = "/storage/v1/upload/resumable/sign"  # TUS with an upload token (x-signature) for a key
+
+
+def _metadata(header: str):
+    pairs = (item.strip().split(" ", 1) for item in header.split(",") if item.strip())
+    return {key: base64.b64decode(value).decode() for key, value in pairs}
+
+
+@app.post("/storage/v1/object/upload/sign/{bucket}/{name:path}")
+async def sign(bucket: str, name: str):
+    token = uuid.uuid4().hex
+    signed[token] = f"{bucket}/{name}"
+    return {"url": f"/object/upload/sign/{bucket}/{name}?token={token}"}
+
+
+@app.put("/storage/v1/object/upload/sign/{bucket}/{name:path}")
+async def put_signed(bucket: str, name: str, token: str, request: Request):
+    if signed.get(token) != f"{bucket}/{name}":
+        return Response(status_code=400, content='{"error":"invalid signature"}')
+    objects[f"{bucket}/{name}"] = (request.headers.get("content-type"), await request.body())
+    return {"Key": f"{bucket}/{name}"}
+
+
+@app.post("/storage/v1/object/{bucket}/{name:path}")
+async def upload(bucket: str, name: str, request: Request):
+    objects[f"{bucket}/{name}"] = (request.headers.get("content-type"), await request.body())
+    return {"Key": f"{bucket}/{name}"}
+
+
+@app.delete("/storage/v1/object/{bucket}")
+async def delete(bucket: str, request: Request):
+    prefixes = (await request.json())["prefixes"]
+    return [{"name": name} for name in prefixes if objects.pop(f"{bucket}/{name}", None)]
+
+
+@app.api_route("/storage/v1/object/authenticated/{bucket}/{name:path}", methods=["GET", "HEAD"])
+async def authenticated(bucket: str, name: str):
+    if f"{bucket}/{name}" not in objects:
+        return Response(status_code=400)
+    content_type, data = objects[f"{bucket}/{name}"]
+    return Response(content=data, media_type=content_type or "application/octet-stream")
+
+
+@app.api_route("/storage/v1/object/public/{bucket}/{name:path}", methods=["GET", "HEAD"])
+async def public(bucket: str, name: str):
+    if f"{bucket}/{name}" not in objects:
+        return Response(status_code=400)
+    content_type, data = objects[f"{bucket}/{name}"]
+    return Response(content=data, media_type=content_type)
+
+
+def _unsigned(request: Request, key: str):
+    """A signed TUS request whose x-signature isn't a token for `key`"""
+    return request.url.path.startswith(SIGNED_TUS_PATH) and signed.get(request.headers.get("x-signature")) != key
+
+
+@app.post("/storage/v1/upload/resumable")
+@app.post(SIGNED_TUS_PATH)
+async def tus_create(request: Request):
+    meta = _metadata(request.headers.get("upload-metadata", ""))
+    key = f"{meta['bucketName']}/{meta['objectName']}"
+    if _unsigned(request, key):
+        return Response(status_code=403)
+    upload_id = uuid.uuid4().hex
+    resumable[upload_id] = {
+        "key": key,
+        "length": int(request.headers["upload-length"]),
+        "content_type": meta.get("contentType"),
+        "data": bytearray(),
+    }
+    return Response(status_code=201, headers={"Location": f"{request.base_url}{request.url.path.lstrip('/')}/{upload_id}"})
+
+
+@app.head("/storage/v1/upload/resumable/{upload_id}")
+@app.head(SIGNED_TUS_PATH + "/{upload_id}")
+async def tus_head(upload_id: str, request: Request):
+    if upload_id not in resumable:
+        return Response(status_code=404)
+    upload = resumable[upload_id]
+    if _unsigned(request, upload["key"]):
+        return Response(status_code=403)
+    return Response(headers={"Upload-Offset": str(len(upload["data"])), "Upload-Length": str(upload["length"])})
+
+
+@app.patch("/storage/v1/upload/resumable/{upload_id}")
+@app.patch(SIGNED_TUS_PATH + "/{upload_id}")
+async def tus_patch(upload_id: str, request: Request):
+    if upload_id not in resumable:
+        return Response(status_code=404)
+    upload = resumable[upload_id]
+    if _unsigned(request, upload["key"]):
+        return Response(status_code=403)
+    if int(request.headers["upload-offset"]) != len(upload["data"]):
+        return Response(status_code=409)
+    chunk = await request.body()
+    if random.random() < FLAKY_RATE:
+        # Like a dropped connection: part of the chunk was stored before it broke
+        upload["data"] += chunk[: len(chunk) // 2]
+        return Response(status_code=500)
+    upload["data"] += chunk
+    if len(upload["data"]) == upload["length"]:
+        objects[upload["key"]] = (upload["content_type"], bytes(upload["data"]))
+    return Response(status_code=204, headers={"Upload-Offset": str(len(upload["data"]))})
+
+
+if __name__ == "__main__":
+    import uvicorn
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--flaky", type=float, default=0.0, help="share of chunk uploads that fail half-way")
+    args = parser.parse_args()
+    FLAKY_RATE = args.flaky
+    print(f"🧪 Fake Supabase Storage on http://localhost:{args.port}")
+    uvicorn.run(app, host="0.0.0.0", port=args.port)
@@ -2,28 +2,38 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.database import engine, Base
-from app.routers import skills, projects, work_experience, education, contact, auth, hobbies, resumes, testimonials, upload
+from app.auth import jwks_cache
+from app.database import async_engine, dispose_engines, Base
+from app.serialization import ORJSONResponse
+from app.compression import CompressionMiddleware
+from app.edge import CacheControlMiddleware
+from app.storage import storage
+from app.routers import skills, projects, work_experience, education, contact, auth, hobbies, resumes, testimonials, upload, portfolio
 
 # Create database tables
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup - only create tables if DATABASE_URL is available
-    # In production (Vercel), tables should already exist
+    # Startup - the Postgres schema is owned by migrate.py (run it on deploy),
+    # only the local SQLite database is created on the fly for development
     try:
-        if os.getenv("DATABASE_URL"):
-            Base.metadata.create_all(bind=engine)
+        if async_engine.dialect.name == "sqlite":
+            async with async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
             print("✓ Database tables checked/created")
     except Exception as e:
         print(f"⚠️ Database initialization warning: {e}")
         # Continue anyway - tables might already exist
     yield
-    # Shutdown (if needed)
+    # Shutdown - release pooled connections (database and storage)
+    jwks_cache.close()
+    await storage.aclose()
+    await dispose_engines()
 
 app = FastAPI(
     title="Portfolio Backend API",
     description="Dynamic Portfolio Backend API with FastAPI",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -40,12 +50,18 @@ frontend_url = os.getenv("FRONTEND_URL")
 if frontend_url:
     cors_origins.append(frontend_url)
 
+# gzip/brotli for responses over COMPRESSION_MIN_SIZE (cached routes bring their own precompressed bodies)
+app.add_middleware(CompressionMiddleware)
+# Cached public routes set their own CDN policy, everything else is `private, no-store`
+app.add_middleware(CacheControlMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allow all origins for Vercel deployments
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Estimate", "Upload-Offset", "Upload-Length"],
 )
 
 # Include routers
@@ -59,6 +75,7 @@ app.include_router(hobbies.router, prefix="/api/hobbies", tags=["Hobbies"])
 app.include_router(resumes.router, prefix="/api/resumes", tags=["Resumes"])
 app.include_router(testimonials.router, prefix="/api/testimonials", tags=["Testimonials"])
 app.include_router(upload.router, prefix="/api/upload", tags=["Upload"])
+app.include_router(portfolio.router, prefix="/api/portfolio", tags=["Portfolio"])
 
 # Note: File uploads should use cloud storage (like Supabase Storage) for serverless
 # StaticFiles mounting doesn't work well in serverless environments
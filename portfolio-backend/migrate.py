@@ -0,0 +1,133 @@
+"""
+Versioned schema migrations for the portfolio database.
+Applied versions are recorded in the schema_migrations table, so running this
+again only applies what's new. Indexes are built with CREATE INDEX CONCURRENTLY
+on Postgres, so they can be added to the live database without locking writes.
+
+Usage:
+    python migrate.py           # apply pending migrations
+    python migrate.py --status  # list applied / pending migrations
+"""
+
+import sys
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+from app.database import engine, Base
+from app import models  # noqa: F401  (registers every table on Base.metadata)
+from app.portfolio_snapshot import build_snapshots
+
+
+def _create_tables(conn, *names):
+    tables = [Base.metadata.tables[name] for name in names]
+    Base.metadata.create_all(bind=conn, tables=tables, checkfirst=True)
+
+
+def _create_indexes(conn, *names):
+    """Create indexes by name, online (CONCURRENTLY) on Postgres, skipping existing ones"""
+    indexes = {index.name: index for table in Base.metadata.tables.values() for index in table.indexes}
+    for name in names:
+        index = indexes[name]
+        if conn.dialect.name == "postgresql" and conn.execute(text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ), {"name": name}).first():
+            # A failed CONCURRENTLY build leaves an invalid index that IF NOT EXISTS would keep
+            conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+        postgres_options = index.dialect_options["postgresql"]
+        postgres_options["concurrently"] = conn.dialect.name == "postgresql"
+        try:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        finally:
+            postgres_options["concurrently"] = False
+        print(f"   ✓ {name}")
+
+
+def _add_columns(conn, table_name, *names):
+    """Add model columns missing from an existing table (nullable, no default)"""
+    table = Base.metadata.tables[table_name]
+    existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    for name in names:
+        if name in existing:
+            continue
+        column_type = table.columns[name].type.compile(dialect=conn.dialect)
+        conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN "{name}" {column_type}'))
+        print(f"   ✓ {table_name}.{name}")
+
+
+# (version, description, upgrade) - append new migrations, never edit applied ones
+MIGRATIONS = [
+    ("0001", "baseline tables", lambda conn: _create_tables(
+        conn, "skills", "projects", "work_experience", "education", "contact_messages",
+        "admins", "hobbies", "resumes", "testimonials",
+    )),
+    ("0002", "indexes for public filters and admin listings", lambda conn: _create_indexes(
+        conn,
+        "ix_skills_active_display_order",
+        "ix_projects_active_display_order",
+        "ix_projects_featured_display_order",
+        "ix_work_experience_active_start_date",
+        "ix_education_active_start_date",
+        "ix_contact_messages_created_at_id",
+        "ix_hobbies_active_display_order",
+        "ix_resumes_language_is_active",
+        "ix_testimonials_approved_display_order",
+        "ix_testimonials_status_created_at",
+    )),
+    ("0003", "resumable uploads", lambda conn: _create_tables(conn, "resumable_uploads")),
+    ("0004", "project video poster and duration", lambda conn: _add_columns(
+        conn, "projects", "video_poster_url", "video_duration",
+    )),
+    ("0005", "content-addressed upload index", lambda conn: _create_tables(conn, "stored_files")),
+    ("0006", "stored portfolio payload per language", lambda conn: (
+        _create_tables(conn, "portfolio_snapshot"), build_snapshots(conn),
+    )),
+    ("0007", "keyset index for the unfiltered testimonial admin list", lambda conn: _create_indexes(
+        conn, "ix_testimonials_created_at_id",
+    )),
+    ("0008", "re-render stored portfolio payloads (UTC timestamps as Z)", build_snapshots),
+    ("0009", "upload token for client-side resumable chunks", lambda conn: _add_columns(
+        conn, "resumable_uploads", "upload_token",
+    )),
+]
+
+
+def applied_versions(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version VARCHAR(20) PRIMARY KEY, "
+        "description VARCHAR(200), "
+        "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    ))
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def migrate():
+    # Autocommit: CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        done = applied_versions(conn)
+        pending = [migration for migration in MIGRATIONS if migration[0] not in done]
+        if not pending:
+            print("✅ Database schema is up to date")
+            return
+        for version, description, upgrade in pending:
+            print(f"📦 Applying {version}: {description}")
+            upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+                {"version": version, "description": description},
+            )
+        print(f"✅ Applied {len(pending)} migration(s)")
+
+
+def status():
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        done = applied_versions(conn)
+    for version, description, _ in MIGRATIONS:
+        print(f"{'✓' if version in done else '·'} {version} {description}")
+
+
+if __name__ == "__main__":
+    if "--status" in sys.argv:
+        status()
+    else:
+        migrate()
@@ -7,6 +7,7 @@ Just run: python seed_data.py
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.models import Skill, Project, WorkExperience, Education, Hobby
+import app.portfolio_snapshot  # noqa: F401  (commits also rebuild the stored portfolio payload)
 from app.database import Base
 import os
 from dotenv import load_dotenv
@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+# The app reads its configuration when it's imported: point it at a throwaway SQLite
+# database and at hosts the tests serve in-process (see the `services` fixture)
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["SUPABASE_URL"] = "http://storage.test"
+os.environ["SUPABASE_ANON_KEY"] = "test-anon-key"
+os.environ["SUPABASE_SERVICE_KEY"] = "test-service-secret-of-at-least-32-bytes"
+os.environ["SUPABASE_JWT_SECRET"] = "test-jwt-secret-of-at-least-32-bytes!"
+os.environ["EDGE_PURGE_URL"] = "http://edge.test/__purge"
+for name in ("DATABASE_READ_URL", "SQLITE_REPLICA_PATH", "SNAPSHOT_ON_WRITE"):
+    os.environ.pop(name, None)
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def app():
+    import main
+    from app.cache import cache
+
+    cache.clear()
+    async with main.app.router.lifespan_context(main.app):
+        yield main.app
+    main.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://api.test") as client:
+        yield client
+
+
+@pytest.fixture
+def admin(app):
+    """Requests are signed in as an admin, without a real token"""
+    from app.auth import get_current_user
+
+    user = {"id": "test-admin", "email": "admin@example.com", "role": "authenticated"}
+    app.dependency_overrides[get_current_user] = lambda: user
+    return user
+
+
+@pytest.fixture
+async def services(app):
+    """The shared storage client (storage and purge calls), routed to in-process fakes:
+    fake_storage.py for http://storage.test and fake_edge.py for http://edge.test"""
+    import fake_edge
+    import fake_storage
+    from app.storage import storage
+
+    storage._client = httpx.AsyncClient(mounts={
+        "http://storage.test": httpx.ASGITransport(app=fake_storage.app),
+        "http://edge.test": httpx.ASGITransport(app=fake_edge.app),
+    })
+    yield
+    await storage.aclose()
+
+
+@pytest.fixture
+def storage_server(services):
+    """fake_storage.py, emptied (SUPABASE_URL is http://storage.test)"""
+    import fake_storage
+
+    for state in (fake_storage.objects, fake_storage.signed, fake_storage.resumable):
+        state.clear()
+    return fake_storage
+
+
+@pytest.fixture
+async def edge(services, client):
+    """A client going through fake_edge.py, the CDN stand-in, in front of the API under test
+    (EDGE_PURGE_URL is its /__purge)"""
+    import fake_edge
+
+    fake_edge.entries.clear()
+    fake_edge.variants.clear()
+    fake_edge._client = client
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_edge.app), base_url="http://edge.test") as edge:
+        yield edge
+    fake_edge._client = None
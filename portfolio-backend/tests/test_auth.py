@@ -0,0 +1,57 @@
+import json
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def jwks_server(monkeypatch):
+    """Serve a one-key JWKS through httpx, failing while `responses` holds error statuses"""
+    key = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(ec.generate_private_key(ec.SECP256R1()).public_key()))
+    server = {"responses": [], "requests": 0}
+
+    def handler(request):
+        server["requests"] += 1
+        status = server["responses"].pop(0) if server["responses"] else 200
+        return httpx.Response(status, json={"keys": [{**key, "kid": "k1", "alg": "ES256", "use": "sig"}]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+    return server
+
+
+async def test_failed_jwks_fetch_is_not_repeated_by_every_request(jwks_server):
+    from app import auth
+
+    jwks = auth.JWKSCache("http://auth.test/jwks.json")
+    jwks_server["responses"] = [503]
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError):
+            await jwks.get_signing_key("k1")
+    assert jwks_server["requests"] == 1
+
+
+async def test_failed_jwks_fetch_is_retried_after_the_retry_interval(jwks_server, monkeypatch):
+    from app import auth
+
+    monkeypatch.setattr(auth, "JWKS_RETRY_INTERVAL", 0)
+    jwks = auth.JWKSCache("http://auth.test/jwks.json")
+    jwks_server["responses"] = [503]
+    with pytest.raises(jwt.InvalidTokenError):
+        await jwks.get_signing_key("k1")
+    # Not held off for JWKS_MIN_REFETCH_INTERVAL like after a successful fetch
+    assert (await jwks.get_signing_key("k1")).key_id == "k1"
+    assert jwks_server["requests"] == 2
+
+
+async def test_unknown_kid_after_a_fetch_waits_for_the_refetch_interval(jwks_server):
+    from app import auth
+
+    jwks = auth.JWKSCache("http://auth.test/jwks.json")
+    assert (await jwks.get_signing_key("k1")).key_id == "k1"
+    with pytest.raises(jwt.InvalidTokenError):
+        await jwks.get_signing_key("rotated")
+    assert jwks_server["requests"] == 1
@@ -0,0 +1,50 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def skill(n):
+    return {"name_en": f"Skill {n}", "name_fr": f"Compétence {n}", "category": "Tools", "proficiency": 50,
+            "icon_url": f"https://cdn.example.com/icons/skill-{n}.svg"}
+
+
+@pytest.fixture
+async def skills(client, admin, services):
+    """Enough skills for the public responses to get compressed"""
+    created = [(await client.post("/api/skills", json=skill(n))).json()["id"] for n in range(12)]
+    yield created
+    for skill_id in created:
+        await client.delete(f"/api/skills/{skill_id}")
+
+
+@pytest.mark.parametrize("url", ["/api/skills", "/api/portfolio"])
+async def test_if_none_match_gets_a_304_until_a_write(client, skills, url):
+    first = await client.get(url, headers=IDENTITY)
+    etag = first.headers["ETag"]
+    unchanged = await client.get(url, headers={**IDENTITY, "If-None-Match": etag})
+    assert unchanged.status_code == 304 and unchanged.headers["ETag"] == etag
+    assert unchanged.content == b""
+
+    await client.delete(f"/api/skills/{skills.pop()}")
+    changed = await client.get(url, headers={**IDENTITY, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("url", ["/api/skills", "/api/portfolio"])
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+async def test_encoded_etag_still_matches(client, skills, url, encoding):
+    identity_etag = (await client.get(url, headers=IDENTITY)).headers["ETag"]
+    encoded = await client.get(url, headers={"Accept-Encoding": encoding})
+    assert encoded.headers["Content-Encoding"] == encoding
+    tag = encoded.headers["ETag"]
+    assert tag == identity_etag[:-1] + f'-{encoding}"'
+
+    # The client's own tag is confirmed, whatever it accepts now, weak or not
+    for headers in ({"Accept-Encoding": encoding}, IDENTITY):
+        for sent in (tag, f"W/{tag}", f'"other", {tag}'):
+            resp = await client.get(url, headers={**headers, "If-None-Match": sent})
+            assert resp.status_code == 304
+            assert resp.headers["ETag"] == sent.split(", ")[-1]
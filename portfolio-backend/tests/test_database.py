@@ -0,0 +1,20 @@
+from app.database import _to_async_url
+
+
+def test_neon_connection_string_keeps_only_what_asyncpg_accepts():
+    url, connect_args = _to_async_url(
+        "postgresql://u:p@ep-x.neon.tech/db?sslmode=require&channel_binding=require"
+        "&connect_timeout=10&target_session_attrs=read-write&application_name=portfolio&options=endpoint%3Dep-x"
+    )
+    assert url.drivername == "postgresql+asyncpg"
+    assert dict(url.query) == {}
+    assert connect_args["ssl"] == "require"
+    assert connect_args["timeout"] == 10.0
+    assert connect_args["target_session_attrs"] == "read-write"
+    assert connect_args["server_settings"] == {"application_name": "portfolio", "options": "endpoint=ep-x"}
+
+
+def test_sslmode_disable_skips_tls():
+    url, connect_args = _to_async_url("postgresql://u:p@localhost/db?sslmode=disable")
+    assert dict(url.query) == {}
+    assert "ssl" not in connect_args
@@ -0,0 +1,45 @@
+import pytest
+from app.edge import EDGE_MAX_AGE
+
+pytestmark = pytest.mark.anyio
+
+SKILL = {"name_en": "Python", "name_fr": "Python", "category": "Languages", "proficiency": 90}
+
+
+async def test_public_routes_are_cdn_cacheable_and_tagged(edge):
+    first = await edge.get("/api/skills")
+    assert first.status_code == 200 and first.headers["X-Cache"] == "MISS"
+    assert f"s-maxage={EDGE_MAX_AGE}" in first.headers["Cache-Control"]
+    assert "stale-while-revalidate=" in first.headers["Cache-Control"]
+    assert first.headers["Cache-Tag"] == "skills"
+
+    second = await edge.get("/api/skills")
+    assert second.headers["X-Cache"] == "HIT"
+
+    portfolio = await edge.get("/api/portfolio")
+    assert set(portfolio.headers["Cache-Tag"].split(",")) >= {"skills", "projects", "testimonials"}
+
+
+async def test_private_routes_are_never_cached(client, edge, admin):
+    resp = await client.get("/api/contact")
+    assert resp.headers["Cache-Control"] == "private, no-store"
+    assert (await edge.get("/api/health")).headers["X-Cache"] == "BYPASS"
+
+
+async def test_write_purges_tagged_responses(client, edge, admin):
+    await edge.get("/api/skills")
+    await edge.get("/api/portfolio")
+    await edge.get("/api/projects")
+    cached = {entry["url"] for entry in (await edge.get("/__cache")).json()}
+    assert {"/api/skills", "/api/portfolio", "/api/projects"} <= cached
+
+    created = await client.post("/api/skills", json=SKILL)
+    assert created.status_code == 201
+
+    # The write's purge call dropped everything tagged `skills`, and only that
+    cached = {entry["url"] for entry in (await edge.get("/__cache")).json()}
+    assert cached == {"/api/projects"}
+    refetched = await edge.get("/api/skills")
+    assert refetched.headers["X-Cache"] == "MISS"
+    assert created.json()["id"] in {skill["id"] for skill in refetched.json()}
+    await client.delete(f"/api/skills/{created.json()['id']}")
@@ -0,0 +1,61 @@
+import uuid
+from datetime import datetime
+import pytest
+from sqlalchemy import select, text
+from app.database import AsyncSessionLocal
+from app import models
+
+pytestmark = pytest.mark.anyio
+
+SECOND = datetime(2024, 5, 1, 9, 30, 0)
+
+
+async def seed_same_second(model, make):
+    """Rows sharing one created_at second, stored in both of SQLite's text forms: the
+    server default's 'YYYY-MM-DD HH:MM:SS' and SQLAlchemy's, with microseconds"""
+    async with AsyncSessionLocal() as db:
+        for _ in range(3):
+            db.add(make(created_at=SECOND))
+        db.add(make(created_at=SECOND.replace(microsecond=250000)))
+        await db.flush()
+        for _ in range(3):
+            row = make(id=str(uuid.uuid4()))
+            db.add(row)
+            await db.flush()
+            await db.execute(text(f"UPDATE {model.__tablename__} SET created_at = :at WHERE id = :id"),
+                             {"at": SECOND.isoformat(sep=" "), "id": row.id})
+        await db.commit()
+        return set((await db.execute(select(model.id))).scalars())
+
+
+async def collect(client, url, params=None):
+    pages, cursor = [], None
+    while True:
+        resp = await client.get(url, params={**(params or {}), "limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200
+        pages.append([row["id"] for row in resp.json()])
+        cursor = resp.headers.get("x-next-cursor")
+        if not cursor:
+            return pages
+
+
+@pytest.mark.parametrize("url, model, make", [
+    ("/api/contact", models.ContactMessage,
+     lambda **values: models.ContactMessage(name="n", email="n@example.com", message="m", **values)),
+    ("/api/testimonials/admin/all", models.Testimonial,
+     lambda **values: models.Testimonial(author_name="a", author_email="a@example.com", testimonial_text_en="t", **values)),
+])
+async def test_cursor_pages_are_disjoint_and_complete(client, admin, url, model, make):
+    ids = await seed_same_second(model, make)
+    pages = await collect(client, url)
+    seen = [row_id for page in pages for row_id in page]
+    assert len(seen) == len(set(seen))
+    assert set(seen) == ids
+    assert all(len(page) == 2 for page in pages[:-1])
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24", "WyJ4Il0", "WyJub3QgYSBkYXRlIiwgImlkIl0"])
+async def test_malformed_cursor_is_400(client, admin, cursor):
+    resp = await client.get("/api/contact", params={"cursor": cursor})
+    assert resp.status_code == 400
+    assert resp.json()["detail"].startswith("Invalid cursor")
@@ -0,0 +1,56 @@
+import json
+import pytest
+from sqlalchemy import event
+from app.database import AsyncSessionLocal, Base, async_engine
+from app.localization import localized_columns, localized_rows
+from app import models
+from app.portfolio_snapshot import PORTFOLIO, PUBLIC_SECTIONS, SNAPSHOT_LANGS, build_snapshots
+
+pytestmark = pytest.mark.anyio
+
+MODELS = {mapper.class_.__tablename__: mapper.class_ for mapper in Base.registry.mappers}
+
+
+def render_in_sql(connection, lang):
+    """Each section localized by the database (COALESCE), one query per section and language"""
+    sections = {}
+    for name, section in PUBLIC_SECTIONS.items():
+        statement = section()
+        if lang:
+            statement = statement.with_only_columns(*localized_columns(MODELS[name], lang))
+        sections[name] = localized_rows(connection.execute(statement))
+    return PORTFOLIO.response(sections, lang or None).body
+
+
+async def test_snapshots_match_sql_localization_with_one_query_per_section(app):
+    async with AsyncSessionLocal() as db:
+        db.add(models.Testimonial(
+            author_name="Ada", author_email="ada@example.com", author_position_en="CTO",
+            testimonial_text_en="Only in English", status="approved",
+        ))
+        db.add(models.Testimonial(
+            author_name="Zoé", author_email="zoe@example.com", author_position_fr="Directrice",
+            testimonial_text_en="Great", testimonial_text_fr="Super", status="approved",
+        ))
+        await db.commit()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        async with AsyncSessionLocal() as db:
+            snapshots = await db.run_sync(lambda session: build_snapshots(session.connection()))
+            await db.rollback()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+    selects = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1 + len(PUBLIC_SECTIONS)  # the row lock, then one per section
+
+    async with AsyncSessionLocal() as db:
+        for lang in SNAPSHOT_LANGS:
+            expected = await db.run_sync(lambda session: render_in_sql(session.connection(), lang))
+            assert snapshots[lang]["body"] == expected
+
+    fr = {t["author_name"]: t for t in json.loads(snapshots["fr"]["body"])["testimonials"]}
+    assert fr["Ada"]["testimonial_text"] == "Only in English"  # NULL falls back to the other language
+    assert fr["Zoé"]["testimonial_text"] == "Super" and fr["Ada"]["author_position"] == "CTO"
@@ -0,0 +1,41 @@
+import time
+import jwt
+import pytest
+from sqlalchemy import text
+from app.database import AsyncSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+def admin_token():
+    claims = {"sub": "test-admin", "email": "admin@example.com", "aud": "authenticated", "exp": int(time.time()) + 600}
+    return jwt.encode(claims, "test-jwt-secret-of-at-least-32-bytes!", algorithm="HS256")
+
+
+async def write_behind_the_cache(name):
+    """A write made through another instance: this one's cache isn't invalidated"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(
+            "INSERT INTO hobbies (id, name_en, name_fr, description_en, description_fr, is_active, display_order) "
+            "VALUES (:id, :id, :id, :id, :id, 1, 0)"
+        ), {"id": name})
+        await db.commit()
+
+
+async def test_unverified_authorization_header_gets_the_cached_response(client):
+    before = (await client.get("/api/hobbies/")).json()
+    await write_behind_the_cache("unverified")
+
+    for header in ("x", "Bearer not-a-jwt"):
+        resp = await client.get("/api/hobbies/", headers={"Authorization": header})
+        assert resp.json() == before
+        assert "s-maxage" in resp.headers["Cache-Control"]
+
+
+async def test_admin_token_reads_the_primary_past_the_cache(client):
+    before = (await client.get("/api/hobbies/")).json()
+    await write_behind_the_cache("verified")
+
+    resp = await client.get("/api/hobbies/", headers={"Authorization": f"Bearer {admin_token()}"})
+    assert "verified" in {hobby["id"] for hobby in resp.json()}
+    assert (await client.get("/api/hobbies/")).json() == before
@@ -0,0 +1,153 @@
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+BUCKET = "portfolio-files"
+
+
+async def test_signed_upload_then_finalize(client, admin, storage_server):
+    body = b"%PDF-1.4 resume" * 100
+    resp = await client.post("/api/upload/sign", json={"filename": "cv.pdf", "size": len(body), "content_type": "application/pdf"})
+    assert resp.status_code == 200
+    signed = resp.json()
+    assert signed["method"] == "PUT" and signed["filename"].endswith("_cv.pdf")
+
+    # The browser's PUT goes straight to storage, not through the API
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=storage_server.app)) as browser:
+        put = await browser.put(signed["upload_url"], content=body, headers=signed["headers"])
+    assert put.status_code == 200
+
+    resp = await client.post("/api/upload/finalize", json={"filename": signed["filename"]})
+    assert resp.status_code == 200
+    assert resp.json()["size"] == len(body)
+    assert resp.json()["url"].endswith(f"/object/public/{BUCKET}/{signed['filename']}")
+
+
+async def test_signed_upload_with_sha256_is_stored_once(client, admin, storage_server):
+    import hashlib
+
+    body = b"\x89PNG screenshot" * 200
+    sha256 = hashlib.sha256(body).hexdigest()
+    request = {"filename": "Screen Shot.PNG", "size": len(body), "content_type": "image/png", "sha256": sha256}
+    signed = (await client.post("/api/upload/sign", json=request)).json()
+    assert signed["filename"] == f"{sha256}.png"
+    assert "immutable" in signed["headers"]["Cache-Control"]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=storage_server.app)) as browser:
+        await browser.put(signed["upload_url"], content=body, headers=signed["headers"])
+    done = (await client.post("/api/upload/finalize", json={"filename": signed["filename"], "original_filename": "Screen Shot.PNG"})).json()
+    assert done["sha256"] == sha256
+
+    # The same screenshot again: nothing to upload, same URL
+    again = (await client.post("/api/upload/sign", json=request)).json()
+    assert again["deduplicated"] is True and "upload_url" not in again
+    assert again["url"] == done["url"]
+    # ...and the multipart route knows it too
+    multipart = (await client.post("/api/upload", files={"file": ("copy.png", body, "image/png")})).json()
+    assert multipart["deduplicated"] is True and multipart["url"] == done["url"]
+
+
+async def test_finalize_rejects_bytes_that_dont_match_the_name(client, admin, storage_server):
+    import hashlib
+
+    sha256 = hashlib.sha256(b"what was announced").hexdigest()
+    signed = (await client.post("/api/upload/sign", json={"filename": "a.pdf", "size": 20, "sha256": sha256})).json()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=storage_server.app)) as browser:
+        await browser.put(signed["upload_url"], content=b"something else", headers=signed["headers"])
+    resp = await client.post("/api/upload/finalize", json={"filename": signed["filename"]})
+    assert resp.status_code == 400
+    assert f"{BUCKET}/{signed['filename']}" not in storage_server.objects
+    assert (await client.post("/api/upload/sign", json={"filename": "a.pdf", "size": 20, "sha256": sha256})).json()["deduplicated"] is False
+
+
+async def test_finalize_before_upload_is_404(client, admin, storage_server):
+    resp = await client.post("/api/upload/finalize", json={"filename": "missing_cv.pdf"})
+    assert resp.status_code == 404
+
+
+async def test_resumable_upload_resumes_from_stored_offset(client, admin, storage_server):
+    body = bytes(range(256)) * 40
+    resp = await client.post("/api/upload/resumable", json={"filename": "talk.mp4", "size": len(body), "content_type": "video/mp4"})
+    assert resp.status_code == 201
+    upload = resp.json()
+    assert "/upload/resumable/sign/" in upload["upload_url"] and upload["headers"]["x-signature"]
+
+    # The chunks go straight to storage's TUS endpoint, not through the API
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=storage_server.app)) as browser:
+        async def send(chunk, offset):
+            return await browser.patch(upload["upload_url"], content=chunk, headers={
+                **upload["headers"], "Upload-Offset": str(offset), "Content-Type": "application/offset+octet-stream",
+            })
+
+        assert (await send(body[:4000], 0)).status_code == 204
+        # A client that lost that response asks the API where to resume
+        state = await client.head(f"/api/upload/resumable/{upload['upload_id']}")
+        assert state.headers["Upload-Offset"] == "4000"
+        assert (await send(body[4000:], 4000)).status_code == 204
+
+        unsigned = await browser.patch(upload["upload_url"], content=b"x", headers={"Tus-Resumable": "1.0.0", "Upload-Offset": "0"})
+        assert unsigned.status_code == 403
+
+    done = (await client.get(f"/api/upload/resumable/{upload['upload_id']}")).json()
+    assert done["complete"] is True and done["url"].endswith(done["filename"])
+    assert "upload_url" not in done
+    assert storage_server.objects[f"{BUCKET}/{done['filename']}"][1] == body
+
+
+async def test_image_manifest_reports_ready_or_failed(client, admin, storage_server):
+    import io
+    import json
+    from PIL import Image
+
+    png = io.BytesIO()
+    Image.new("RGB", (400, 300), "teal").save(png, "PNG")
+    files = [("files", ("photo.png", png.getvalue(), "image/png")), ("files", ("broken.png", b"not a png", "image/png"))]
+    resp = await client.post("/api/upload/batch", files=files)
+    photo, broken = resp.json()["results"]
+    assert photo["derivatives"] == broken["derivatives"] == "pending"
+
+    # Background tasks have run once the response is complete
+    manifests = {
+        name: json.loads(storage_server.objects[f"{BUCKET}/{name.rsplit('.', 1)[0]}.srcset.json"][1])
+        for name in (photo["filename"], broken["filename"])
+    }
+    assert manifests[photo["filename"]]["status"] == "ready"
+    assert manifests[photo["filename"]]["variants"]
+    assert manifests[broken["filename"]]["status"] == "failed"
+
+    again = await client.post("/api/upload", files={"file": ("copy.png", png.getvalue(), "image/png")})
+    assert again.json()["deduplicated"] is True and again.json()["derivatives"] == "ready"
+
+
+async def test_shared_object_is_kept_until_its_last_reference_is_gone(client, admin, storage_server):
+    pdf = b"%PDF-1.4 shared" * 50
+    first = (await client.post("/api/upload", files={"file": ("a.pdf", pdf, "application/pdf")})).json()
+    second = (await client.post("/api/upload", files={"file": ("b.pdf", pdf, "application/pdf")})).json()
+    assert second["deduplicated"] is True and second["filename"] == first["filename"]
+
+    resumes = []
+    for language, url in (("en", first["url"]), ("fr", second["url"])):
+        resp = await client.post("/api/resumes/", json={"title_en": "CV", "title_fr": "CV", "file_url": url, "file_name": "cv.pdf", "language": language})
+        resumes.append(resp.json()["id"])
+
+    assert (await client.delete(f"/api/upload/{first['filename']}")).status_code == 409
+    await client.delete(f"/api/resumes/{resumes[0]}")
+    assert (await client.delete(f"/api/upload/{first['filename']}")).status_code == 409
+    await client.delete(f"/api/resumes/{resumes[1]}")
+    assert (await client.delete(f"/api/upload/{first['filename']}")).status_code == 200
+    assert f"{BUCKET}/{first['filename']}" not in storage_server.objects
+
+
+async def test_unreachable_storage_is_502(client, admin, services):
+    from app.storage import storage
+
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    storage._client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+    resp = await client.post("/api/upload/sign", json={"filename": "cv.pdf", "size": 10})
+    assert resp.status_code == 502
+    assert resp.json()["detail"].startswith("Could not reach Supabase Storage")
+    resp = await client.post("/api/upload", files={"file": ("cv.pdf", b"%PDF-1.4 unreachable", "application/pdf")})
+    assert resp.status_code == 502
@@ -34,3 +34,19 @@ api.interceptors.response.use(
     return Promise.reject(error);
   }
 );
+
+// Admin lists are keyset-paginated: one page per call, the X-Next-Cursor header points at
+// the next one (fetched when the user asks for more, so the whole list is never loaded up front)
+export const ADMIN_PAGE_SIZE = 50;
+
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+export const emptyPage = <T>(): Page<T> => ({ items: [], nextCursor: null });
+
+export const getPage = async <T>(url: string, params: Record<string, string> = {}, cursor?: string | null): Promise<Page<T>> => {
+  const response = await api.get<T[]>(url, { params: { ...params, limit: ADMIN_PAGE_SIZE, ...(cursor ? { cursor } : {}) } });
+  return { items: response.data, nextCursor: (response.headers['x-next-cursor'] as string | undefined) ?? null };
+};
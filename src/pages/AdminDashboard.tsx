@@ -18,6 +18,7 @@ import * as resumesService from '../services/resumesService';
 import * as contactService from '../services/contactService';
 import * as testimonialsService from '../services/testimonialsService';
 import { useLanguage } from '../contexts/LanguageContext';
+import { emptyPage } from '../lib/api';
 import { T } from '../components/Translate';
 import { translateBatch } from '../services/translationService';
 
@@ -96,6 +97,54 @@ const FormField = ({
   </div>
 );
 
+// ─── Signed upload: the file goes straight to storage, named by its SHA-256 ────
+const UPLOAD_CONCURRENCY = 4; // parallel signed uploads for a multi-file pick (e.g. a gallery)
+
+const sha256Hex = async (file: File) => {
+  const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+};
+
+const signedUpload = async (file: File, token: string | null): Promise<string> => {
+  const jsonHeaders = { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' };
+  const signRes = await fetch(`${API_HOST}/api/upload/sign`, {
+    method: 'POST',
+    headers: jsonHeaders,
+    body: JSON.stringify({
+      filename: file.name, size: file.size, content_type: file.type || undefined, sha256: await sha256Hex(file),
+    }),
+  });
+  if (!signRes.ok) {
+    const errBody = await signRes.json().catch(() => ({}));
+    throw new Error(errBody.detail || `Upload failed (${signRes.status})`);
+  }
+  const signed = await signRes.json();
+  let data = signed;
+  if (!signed.deduplicated) {
+    // Not stored yet: PUT it to the signed URL, then let the API check and record it
+    const putRes = await fetch(signed.upload_url, {
+      method: signed.method,
+      headers: signed.headers,
+      body: file,
+    });
+    if (!putRes.ok) {
+      throw new Error(`Upload failed (${putRes.status})`);
+    }
+    const res = await fetch(`${API_HOST}/api/upload/finalize`, {
+      method: 'POST',
+      headers: jsonHeaders,
+      body: JSON.stringify({ filename: signed.filename, original_filename: file.name }),
+    });
+    if (!res.ok) {
+      const errBody = await res.json().catch(() => ({}));
+      throw new Error(errBody.detail || `Upload failed (${res.status})`);
+    }
+    data = await res.json();
+  }
+  // If URL is already absolute (Supabase), use as-is; otherwise prepend API_HOST
+  return data.url.startsWith('http') ? data.url : `${API_HOST}${data.url}`;
+};
+
 // ─── File Upload component defined OUTSIDE to prevent remounting ────
 const FileUploadField = ({
   label, name, value, onChange, accept, multiple,
@@ -119,42 +168,33 @@ const FileUploadField = ({
     try {
       const token = localStorage.getItem('token');
       if (multiple) {
-        // Multiple files — upload each, collect URLs as comma-separated string
+        // Multiple files — each one straight to storage like a single file (no request body
+        // through the API, which is capped at 4.5 MB on Vercel), a few at a time
         const urls: string[] = value ? String(value).split(',').map((s: string) => s.trim()).filter(Boolean) : [];
-        for (let i = 0; i < files.length; i++) {
-          const fd = new FormData();
-          fd.append('file', files[i]);
-          const res = await fetch(`${API_HOST}/api/upload`, {
-            method: 'POST',
-            headers: { Authorization: `Bearer ${token}` },
-            body: fd,
-          });
-          if (!res.ok) {
-            const errBody = await res.json().catch(() => ({}));
-            throw new Error(errBody.detail || `Upload failed (${res.status})`);
+        const queue = Array.from(files);
+        const results: (string | null)[] = new Array(queue.length).fill(null);
+        const failed: string[] = [];
+        let next = 0;
+        const worker = async () => {
+          while (next < queue.length) {
+            const index = next++;
+            try {
+              results[index] = await signedUpload(queue[index], token);
+            } catch (err: any) {
+              failed.push(`${queue[index].name}: ${err.message || 'Upload failed'}`);
+            }
           }
-          const data = await res.json();
-          // If URL is already absolute (Supabase), use as-is; otherwise prepend API_HOST
-          const fileUrl = data.url.startsWith('http') ? data.url : `${API_HOST}${data.url}`;
-          urls.push(fileUrl);
-        }
+        };
+        await Promise.all(Array.from({ length: Math.min(UPLOAD_CONCURRENCY, queue.length) }, worker));
+        // Keep the files that made it even if some failed, in the order they were picked
+        urls.push(...results.filter((url): url is string => url !== null));
         onChange(name, urls.join(', '));
-      } else {
-        const fd = new FormData();
-        fd.append('file', files[0]);
-        const res = await fetch(`${API_HOST}/api/upload`, {
-          method: 'POST',
-          headers: { Authorization: `Bearer ${token}` },
-          body: fd,
-        });
-        if (!res.ok) {
-          const errBody = await res.json().catch(() => ({}));
-          throw new Error(errBody.detail || `Upload failed (${res.status})`);
+        if (failed.length) {
+          throw new Error(`${failed.length} file(s) failed — ${failed.join('; ')}`);
         }
-        const data = await res.json();
-        // If URL is already absolute (Supabase), use as-is; otherwise prepend API_HOST
-        const fileUrl = data.url.startsWith('http') ? data.url : `${API_HOST}${data.url}`;
-        onChange(name, fileUrl);
+      } else {
+        // Single file — upload straight to storage with a signed URL (skipped if already stored)
+        onChange(name, await signedUpload(files[0], token));
       }
     } catch (err: any) {
       console.error('Upload error:', err);
@@ -324,6 +364,10 @@ export const AdminDashboard = () => {
   const [resumes, setResumes] = useState<resumesService.Resume[]>([]);
   const [messages, setMessages] = useState<contactService.StoredContactMessage[]>([]);
   const [testimonials, setTestimonials] = useState<testimonialsService.Testimonial[]>([]);
+  // Messages and testimonials come a page at a time: where the next page starts, if there is one
+  const [messagesCursor, setMessagesCursor] = useState<string | null>(null);
+  const [testimonialsCursor, setTestimonialsCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // Modal state
   const [modalOpen, setModalOpen] = useState(false);
@@ -388,8 +432,8 @@ export const AdminDashboard = () => {
         projectsService.getProjects().catch(() => []),
         educationService.getEducation().catch(() => []),
         resumesService.getResumes().catch(() => []),
-        contactService.getContactMessages().catch(() => []),
-        testimonialsService.getAllTestimonialsAdmin().catch(() => []),
+        contactService.getContactMessages().catch(() => emptyPage<contactService.StoredContactMessage>()),
+        testimonialsService.getAllTestimonialsAdmin().catch(() => emptyPage<testimonialsService.Testimonial>()),
       ]);
       setSkills(s);
       setExperiences(e);
@@ -397,13 +441,36 @@ export const AdminDashboard = () => {
       setProjects(p);
       setEducation(ed);
       setResumes(r);
-      setMessages(m);
-      setTestimonials(t);
+      setMessages(m.items);
+      setMessagesCursor(m.nextCursor);
+      setTestimonials(t.items);
+      setTestimonialsCursor(t.nextCursor);
     } finally {
       setLoading(false);
     }
   }, []);
 
+  // Next page of the messages / testimonials tab, appended to what's loaded
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      await syncToken();
+      if (activeTab === 'messages' && messagesCursor) {
+        const page = await contactService.getContactMessages(messagesCursor);
+        setMessages(prev => [...prev, ...page.items]);
+        setMessagesCursor(page.nextCursor);
+      } else if (activeTab === 'testimonials' && testimonialsCursor) {
+        const page = await testimonialsService.getAllTestimonialsAdmin(undefined, testimonialsCursor);
+        setTestimonials(prev => [...prev, ...page.items]);
+        setTestimonialsCursor(page.nextCursor);
+      }
+    } catch (err: any) {
+      alert(err.response?.data?.detail || (language === 'fr' ? 'Échec du chargement' : 'Failed to load more'));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (isAdmin) loadAll();
   }, [isAdmin, loadAll]);
@@ -716,6 +783,9 @@ export const AdminDashboard = () => {
     : activeTab === 'messages' ? messages
     : activeTab === 'testimonials' ? testimonials
     : hobbies;
+  const nextCursor = activeTab === 'messages' ? messagesCursor
+    : activeTab === 'testimonials' ? testimonialsCursor
+    : null;
 
   const renderRow = (item: any) => {
     if (activeTab === 'skills') {
@@ -1274,6 +1344,19 @@ export const AdminDashboard = () => {
                 </table>
               </div>
             )}
+            {!loading && nextCursor && (
+              <div className="flex justify-center mt-6">
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="flex items-center gap-2 px-6 py-3 rounded-lg text-sm tracking-wider uppercase transition-all border disabled:opacity-50"
+                  style={{ ...font, backgroundColor: 'rgba(0,255,255,0.08)', borderColor: 'rgba(0,255,255,0.2)', color: '#22d3ee' }}
+                >
+                  {loadingMore ? <Loader2 size={16} className="animate-spin" /> : <ChevronDown size={16} />}
+                  <T>Load more</T>
+                </button>
+              </div>
+            )}
           </motion.div>
         </div>
       </div>
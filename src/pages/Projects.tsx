@@ -233,6 +233,7 @@ export const Projects = () => {
               <video
                 key={currentProject.video_url}
                 src={currentProject.video_url}
+                poster={currentProject.video_poster_url}
                 autoPlay
                 loop
                 muted
@@ -156,6 +156,8 @@ export const Testimonials = () => {
   const [adminFilter, setAdminFilter] = useState<string>('pending');
   const [loadingAdmin, setLoadingAdmin] = useState(false);
   const [adminPage, setAdminPage] = useState(0);
+  // Where the next page of testimonials starts on the server, if there's one
+  const [adminCursor, setAdminCursor] = useState<string | null>(null);
 
   // Submission form
   const [showForm, setShowForm] = useState(false);
@@ -248,8 +250,9 @@ export const Testimonials = () => {
       setLoadingAdmin(true);
       setAdminError('');
       await syncToken();
-      const data = await testimonialsService.getAllTestimonialsAdmin(adminFilter || undefined);
-      setAllTestimonials(data);
+      const page = await testimonialsService.getAllTestimonialsAdmin(adminFilter || undefined);
+      setAllTestimonials(page.items);
+      setAdminCursor(page.nextCursor);
       setAdminPage(0);
     } catch (err: any) {
       const detail = err.response?.data?.detail || err.message || 'Unknown error';
@@ -260,6 +263,24 @@ export const Testimonials = () => {
     }
   };
 
+  // Next carousel page; past the last loaded one, fetch the next server page first
+  const nextAdminPage = async () => {
+    if (adminPage + 1 < adminTotalPages || !adminCursor) {
+      setAdminPage((prev) => (prev + 1) % adminTotalPages);
+      return;
+    }
+    try {
+      await syncToken();
+      const page = await testimonialsService.getAllTestimonialsAdmin(adminFilter || undefined, adminCursor);
+      setAllTestimonials((prev) => [...prev, ...page.items]);
+      setAdminCursor(page.nextCursor);
+      if (page.items.length) setAdminPage((prev) => prev + 1);
+    } catch (err: any) {
+      const detail = err.response?.data?.detail || err.message || 'Unknown error';
+      setAdminError(`Failed to load testimonials: ${detail}`);
+    }
+  };
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     setSubmitError('');
@@ -721,9 +742,9 @@ export const Testimonials = () => {
                   </div>
 
                   {/* Right Arrow */}
-                  {adminTotalPages > 1 && (
+                  {(adminTotalPages > 1 || adminCursor) && (
                     <motion.button
-                      onClick={() => setAdminPage((prev) => (prev + 1) % adminTotalPages)}
+                      onClick={nextAdminPage}
                       whileHover={{ scale: 1.1, x: 3 }}
                       whileTap={{ scale: 0.95 }}
                       className="flex-shrink-0 w-12 h-12 rounded-lg flex items-center justify-center transition-all"
@@ -755,7 +776,7 @@ export const Testimonials = () => {
                 {/* Count */}
                 <div className="text-center mt-2 flex-shrink-0">
                   <span className="text-xs tracking-widest" style={{ fontFamily: "'GT Pressura', sans-serif", color: 'rgba(255,255,255,0.6)' }}>
-                    {adminPage * ITEMS_PER_PAGE + 1} &#x2013; {Math.min((adminPage + 1) * ITEMS_PER_PAGE, allTestimonials.length)} of {allTestimonials.length}
+                    {adminPage * ITEMS_PER_PAGE + 1} &#x2013; {Math.min((adminPage + 1) * ITEMS_PER_PAGE, allTestimonials.length)} of {allTestimonials.length}{adminCursor ? '+' : ''}
                   </span>
                 </div>
               </>
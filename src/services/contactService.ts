@@ -1,5 +1,5 @@
 import emailjs from '@emailjs/browser';
-import { api } from '@/lib/api';
+import { api, getPage, Page } from '@/lib/api';
 
 const EMAILJS_SERVICE_ID = 'service_ds5co9t';
 const EMAILJS_TEMPLATE_ID = 'template_pcw8f7h';
@@ -151,10 +151,9 @@ export const sendContactMessageDirect = async (data: ContactMessage): Promise<vo
   }
 };
 
-// Admin: Get all contact messages
-export const getContactMessages = async (): Promise<StoredContactMessage[]> => {
-  const response = await api.get('/contact');
-  return response.data;
+// Admin: Get a page of contact messages, newest first (pass the previous page's nextCursor for more)
+export const getContactMessages = async (cursor?: string | null): Promise<Page<StoredContactMessage>> => {
+  return getPage<StoredContactMessage>('/contact', {}, cursor);
 };
 
 // Admin: Mark a message as read
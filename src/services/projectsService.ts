@@ -10,6 +10,8 @@ export interface Project {
   short_description_fr?: string;
   image_url?: string;
   video_url?: string;
+  video_poster_url?: string;
+  video_duration?: number;
   gallery_urls?: string[];
   project_url?: string;
   github_url?: string;
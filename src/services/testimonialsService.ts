@@ -1,4 +1,4 @@
-import { api } from '@/lib/api';
+import { api, getPage, Page } from '@/lib/api';
 
 export interface Testimonial {
   id: string;
@@ -40,12 +40,11 @@ export const submitTestimonial = async (data: TestimonialSubmission): Promise<Te
   return response.data;
 };
 
-// Admin: Get all testimonials (with optional status filter)
-export const getAllTestimonialsAdmin = async (statusFilter?: string): Promise<Testimonial[]> => {
+// Admin: Get a page of testimonials, newest first (with optional status filter; pass the previous page's nextCursor for more)
+export const getAllTestimonialsAdmin = async (statusFilter?: string, cursor?: string | null): Promise<Page<Testimonial>> => {
   const params: Record<string, string> = {};
   if (statusFilter) params.status_filter = statusFilter;
-  const response = await api.get('/testimonials/admin/all', { params });
-  return response.data;
+  return getPage<Testimonial>('/testimonials/admin/all', params, cursor);
 };
 
 // Admin: Approve a testimonial